@@ -0,0 +1,99 @@
+"""
+Batched file operations for the Photo-Flow application.
+
+Copies and deletions are submitted to a thread pool so several files are in flight
+at once. SD cards and USB SSDs only reach their rated throughput with a queue depth
+above one; working file by file leaves the device idle on every round trip.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, List, Optional, Tuple
+
+from photo_flow.config import BATCH_IO_WORKERS
+from photo_flow.file_manager import FileManager
+
+
+def batch_copy(pairs: List[Tuple[Path, Path]],
+               max_workers: int = BATCH_IO_WORKERS,
+               on_done: Optional[Callable[[Path, bool, str], None]] = None) -> List[Tuple[bool, str]]:
+    """
+    Copy many files concurrently, each with FileManager.safe_copy's duplicate check and verification.
+
+    Args:
+        pairs (List[Tuple[Path, Path]]): (source, destination) paths to copy
+        max_workers (int): Maximum number of copies in flight at once
+        on_done (Callable, optional): Called as on_done(src, success, error) from the calling
+                                      thread after each copy finishes, in submission order
+
+    Returns:
+        List[Tuple[bool, str]]: (success, error_message) for each pair, in the same order as pairs
+    """
+    return _run_batch(FileManager.safe_copy, pairs, [src for src, _ in pairs], max_workers, on_done)
+
+
+def batch_is_duplicate(pairs: List[Tuple[Path, Path]],
+                       max_workers: int = os.cpu_count() or 1) -> List[Tuple[bool, str]]:
+    """
+    Run FileManager.is_duplicate for many (source, destination) pairs concurrently.
+
+    File reads release the GIL, so the I/O of several hashes overlaps instead of queuing.
+
+    Args:
+        pairs (List[Tuple[Path, Path]]): (source, destination) paths to compare
+        max_workers (int): Maximum number of comparisons in flight at once
+
+    Returns:
+        List[Tuple[bool, str]]: (is_duplicate, error_message) for each pair, in the same order as pairs
+    """
+    return _run_batch(FileManager.is_duplicate, pairs, [src for src, _ in pairs], max_workers, None)
+
+
+def batch_unlink(paths: List[Path],
+                 max_workers: int = BATCH_IO_WORKERS,
+                 on_done: Optional[Callable[[Path, bool, str], None]] = None) -> List[Tuple[bool, str]]:
+    """
+    Delete many files concurrently.
+
+    Args:
+        paths (List[Path]): Files to delete
+        max_workers (int): Maximum number of deletions in flight at once
+        on_done (Callable, optional): Called as on_done(path, success, error) from the calling
+                                      thread after each deletion finishes, in submission order
+
+    Returns:
+        List[Tuple[bool, str]]: (success, error_message) for each path, in the same order as paths
+    """
+    return _run_batch(_unlink, [(path,) for path in paths], paths, max_workers, on_done)
+
+
+def _unlink(path: Path) -> Tuple[bool, str]:
+    """Delete a single file, returning (success, error_message)."""
+    try:
+        path.unlink()
+        return True, ""
+    except Exception as e:
+        return False, str(e)
+
+
+def _run_batch(func: Callable[..., Tuple[bool, str]], args_list: List[tuple], keys: List[Path],
+               max_workers: int, on_done: Optional[Callable[[Path, bool, str], None]]) -> List[Tuple[bool, str]]:
+    """Run func(*args) for every args tuple on a thread pool and collect results in order."""
+    if not args_list:
+        return []
+
+    results = []
+    executor = ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(args_list))))
+    try:
+        futures = [executor.submit(func, *args) for args in args_list]
+        for key, future in zip(keys, futures):
+            success, error = future.result()
+            results.append((success, error))
+            if on_done:
+                on_done(key, success, error)
+    finally:
+        # On Ctrl+C, let in-flight operations finish (safe_copy never leaves a partial file
+        # unverified) but drop everything still queued
+        executor.shutdown(wait=True, cancel_futures=True)
+    return results
@@ -17,6 +17,9 @@ GALLERY_PATH = Path("/Users/johannes.krumm/SourceRoot/photo-flow/photo_gallery/s
 # Remote backup (homelab) settings
 HOMELAB_USER = "jkrumm"
 HOMELAB_HOST = "100.85.139.104"  # Tailscale IP
+HOMELAB_SSH_PORT = 22
+# Seconds to wait for a TCP connect to the homelab before giving up (fail fast when offline)
+HOMELAB_PROBE_TIMEOUT = 2
 # SSD backup path (for Final JPEGs - fast access)
 HOMELAB_SSD_FINAL_PATH = Path("/home/jkrumm/ssd/SSD/Bilder/Fuji")
 # HDD backup paths (for large files - RAWs and Videos)
@@ -26,24 +29,86 @@ HOMELAB_HDD_VIDEOS_PATH = Path("/mnt/hdd/fuji/Videos")
 HOMELAB_TRASH_PATH = Path("/mnt/hdd/fuji/.trash")
 # Legacy alias for backwards compatibility
 HOMELAB_DEST_PATH = HOMELAB_SSD_FINAL_PATH
+# First backup into an empty remote folder with more files than this streams a tar over
+# ssh instead of rsync (no per-file round trips); incremental runs always use rsync.
+# 0 disables bulk mode.
+HOMELAB_BULK_THRESHOLD = 0
 # Default rsync flags optimized for speed and safety over SSH
 # -a archive, -v verbose (shows files being transferred), --delete keep remote in sync
 # --partial resume partial transfers, --whole-file avoids delta CPU overhead for new/changed files
 # --progress shows transfer speed and file numbers
-RSYNC_FLAGS = ["-av", "--delete", "--partial", "--whole-file", "--progress"]
+RSYNC_FLAGS = ("-av", "--delete", "--partial", "--whole-file", "--progress")
 # Exclude system files from rsync (macOS resource forks, Windows thumbnails, etc.)
 # These files are not portable and not part of the actual photo data
-RSYNC_EXCLUDE_PATTERNS = [
+RSYNC_EXCLUDE_PATTERNS = (
     ".DS_Store",      # macOS folder view settings
     "._*",            # macOS AppleDouble resource forks (extended attributes)
     "Thumbs.db",      # Windows thumbnail cache
     ".Spotlight-V100", # macOS Spotlight index
     ".Trashes",       # macOS trash folder
     ".fseventsd",     # macOS filesystem events
-]
+)
 # Use a faster SSH configuration: disable SSH stream compression and prefer a fast cipher
+# aes128-gcm is hardware accelerated (AES-NI / ARMv8 crypto extensions); chacha20 is the
+# fallback if the server disables it. Both are AEAD ciphers, so no separate MAC is computed.
+# ServerAlive* detects a dead connection after ~45s instead of waiting for the TCP timeout.
+# ControlMaster multiplexes all rsync shards and remote commands over one SSH connection,
+# so only the first one pays for key exchange and authentication (%C = hash of host/user/port).
 # Connection via Tailscale (encrypted mesh network, no port exposure needed)
-RSYNC_SSH_CMD = "ssh -T -c aes128-gcm@openssh.com -o Compression=no -o ConnectTimeout=5"
+SSH_CONTROL_PATH = "~/.ssh/cm-photoflow-%C"
+RSYNC_SSH_CMD = (
+    "ssh -T -c aes128-gcm@openssh.com,chacha20-poly1305@openssh.com "
+    "-o Compression=no -o ConnectTimeout=5 -o ServerAliveInterval=15 -o ServerAliveCountMax=3 "
+    f"-o ControlMaster=auto -o ControlPath={SSH_CONTROL_PATH} -o ControlPersist=60s"
+)
+# Maximum number of parallel rsync processes per backup (files are split into size-balanced shards)
+# Capped at the CPU count; set to 1 to always use a single rsync stream
+RSYNC_MAX_SHARDS = 4
+# Remote directory (relative to the destination) where interrupted transfers are kept for resuming
+RSYNC_PARTIAL_DIR = ".rsync-partial"
+# Abort rsync if no data is transferred for this many seconds (stalled network)
+RSYNC_IO_TIMEOUT = 120
+# Send changed files whole (--whole-file) instead of using rsync's delta-transfer algorithm.
+# Photos and videos are write-once, entropy-coded data where deltas never match, so the
+# rolling checksums only cost CPU on both ends. Disable for slow links with many edits.
+RSYNC_WHOLE_FILE = True
+# Preallocate destination files (--preallocate) so the homelab's ext4/XFS disks get contiguous
+# extents. Needs rsync >= 3.1 on both ends (checked at runtime, skipped otherwise).
+RSYNC_PREALLOCATE = True
+# Gallery web server (VPS) the built gallery is synced to
+GALLERY_SSH_TARGET = "jkrumm@100.82.157.104"
+GALLERY_REMOTE_PATH = "/home/jkrumm/sideproject-docker-stack/photo_gallery"
+# How long the gallery's SSH control connection, opened while npm builds, stays alive unused
+GALLERY_SSH_CONTROL_PERSIST = "10m"
+# File suffixes the gallery rsync sends uncompressed (already entropy-coded, -z only costs CPU)
+GALLERY_RSYNC_SKIP_COMPRESS = "jpg/jpeg/png/webp/avif/heic/mp4/mov/woff/woff2/gz/br/zip"
+
+# Parallel rsync processes for the gallery push (one per top-level folder of dist/)
+GALLERY_RSYNC_WORKERS = 4
+
+# Fingerprint of the last gallery build pushed successfully (an identical rebuild skips rsync)
+GALLERY_DIST_HASH_PATH = Path.home() / ".cache" / "photo_flow" / "gallery_dist.hash"
+
+# Per-backup manifests of what the last successful homelab backup sent. Later runs hand rsync
+# only new/changed files; a full comparison still runs at least every BACKUP_FULL_SCAN_DAYS.
+BACKUP_MANIFEST_DIR = Path.home() / ".cache" / "photo_flow" / "backup_manifests"
+BACKUP_FULL_SCAN_DAYS = 7
+
+# Persistent hash cache (SQLite) so unchanged files are not re-hashed on every run
+HASH_CACHE_PATH = Path.home() / ".cache" / "photo_flow" / "hashes.db"
+
+# Number of file copies kept in flight at once during imports (queue depth for SD cards/SSDs)
+BATCH_IO_WORKERS = 8
+
+# Import videos, photos and RAWs concurrently when their destinations are on different disks
+PARALLEL_IMPORT = True
+
+# Seconds a camera card listing is reused by consecutive operations (status, import, finalize)
+CAMERA_SCAN_TTL = 5
+
+# Photos compressed concurrently by finalize (capped at the CPU count; 1 = one at a time).
+# Compression is CPU-bound and each photo also spawns exiftool, so workers overlap well.
+FINALIZE_WORKERS = 4
 
 # Image processing settings
 CLARITY_ADJUSTMENT = -3
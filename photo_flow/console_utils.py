@@ -70,12 +70,15 @@ def show_status(message: str, spinner: str = "dots"):
         message: Status message to display
         spinner: Spinner style (default: "dots")
 
+    Yields:
+        The Rich Status, whose update() can replace the message while it runs
+
     Example:
         with show_status("Building gallery..."):
             run_npm_build()
     """
-    with console.status(f"[bold blue]{message}[/bold blue]", spinner=spinner):
-        yield
+    with console.status(f"[bold blue]{message}[/bold blue]", spinner=spinner) as status:
+        yield status
 
 
 def create_progress() -> Progress:
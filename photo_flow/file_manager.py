@@ -4,12 +4,21 @@ File management utilities for the Photo-Flow application.
 This module provides functionality for scanning, copying, and verifying files.
 """
 
-import hashlib
+import errno
+import fnmatch
+import os
 import shutil
+import stat
+import tempfile
+import time
 from pathlib import Path
-from typing import Dict, List
+from typing import Dict, FrozenSet, Iterable, Iterator, List, Optional, Tuple
 
-from photo_flow.config import CAMERA_PATH, EXTENSIONS
+import xxhash
+
+from photo_flow.config import CAMERA_PATH, CAMERA_SCAN_TTL, EXTENSIONS
+from photo_flow.hash_cache import HashCache
+from photo_flow.timestamp_renamer import extract_original_base
 
 
 def is_valid_image_file(file_path: Path) -> bool:
@@ -30,6 +39,11 @@ def is_valid_image_file(file_path: Path) -> bool:
     )
 
 
+def _normalize_extension(extension: str) -> str:
+    """Normalize an extension to the '.UPPER' form used as dictionary key."""
+    return f".{extension.lstrip('.').upper()}"
+
+
 def scan_for_images(directory: Path, extension: str = '.JPG') -> List[Path]:
     """
     Scan a directory for image files with case-insensitive extension matching.
@@ -41,20 +55,137 @@ def scan_for_images(directory: Path, extension: str = '.JPG') -> List[Path]:
     Returns:
         List[Path]: List of valid image files
     """
-    # Remove the dot if present to normalize the extension
-    if extension.startswith('.'):
-        extension = extension[1:]
+    return FileManager.scan_by_extensions(directory, [extension])[_normalize_extension(extension)]
+
+
+def scan_for_images_iter(directory: Path, extension: str = '.JPG') -> Iterator[Path]:
+    """
+    Lazily yield the image files scan_for_images would return, in directory order.
+
+    For counting or existence checks: no list is built and nothing is sorted, and a
+    consumer that stops early stops the directory read too.
+
+    Args:
+        directory (Path): Directory to scan (not recursive)
+        extension (str): File extension to look for (default: '.JPG')
+
+    Yields:
+        Path: Valid image files with the extension (case-insensitive)
+    """
+    wanted = _normalize_extension(extension)
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                name = entry.name
+                if '.' not in name or '.' + name.rsplit('.', 1)[-1].upper() != wanted:
+                    continue
+                if entry.is_file():
+                    file_path = Path(entry.path)
+                    if is_valid_image_file(file_path):
+                        yield file_path
+    except FileNotFoundError:
+        return
+
+
+def count_at_least(directory: Path, pattern: str, threshold: int) -> bool:
+    """
+    Check whether a directory contains at least `threshold` valid files matching a glob pattern.
 
-    # Get both uppercase and lowercase versions
-    upper_ext = f'*.{extension.upper()}'
-    lower_ext = f'*.{extension.lower()}'
+    Stops reading the directory as soon as the threshold is reached, so safety checks
+    on large folders cost a handful of entries instead of a full scan.
+
+    Args:
+        directory (Path): Directory to check (not recursive)
+        pattern (str): Case-sensitive glob pattern for file names (e.g. '*.JPG')
+        threshold (int): Number of matching files required
+
+    Returns:
+        bool: True if at least `threshold` matching files exist
+    """
+    if threshold <= 0:
+        return True
+
+    count = 0
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if (fnmatch.fnmatchcase(entry.name, pattern) and entry.is_file()
+                    and is_valid_image_file(Path(entry.path))):
+                count += 1
+                if count >= threshold:
+                    return True
+    return False
+
+
+# Name prefix of temp files created next to a destination before the final rename. '._' makes
+# scans and rsync skip them like macOS resource forks; crash leftovers are swept by the workflow
+# step that writes to the directory (import, finalize, gallery sync).
+OUTPUT_TEMP_PREFIX = '._photoflow-'
+
+# Hash modes stored in the persistent cache (algorithm + coverage); a new algorithm never
+# matches digests cached by an old one
+_HASH_MODE_FULL = "xxh3_128:full"
+_HASH_MODE_PARTIAL = "xxh3_128:partial"
+# Read size for hashing (one reusable buffer of this size per hash); 1 MiB keeps the
+# syscall count low for multi-megabyte JPEGs and RAFs
+_HASH_CHUNK_SIZE = 1024 * 1024
+
+def _hash_file_range(hasher, f, length: int = -1) -> None:
+    """
+    Feed bytes from the current position of an unbuffered binary file into a hasher.
+
+    Reads into one preallocated buffer instead of allocating a new bytes object per chunk.
+
+    Args:
+        hasher: Hash object with an update() method accepting buffers
+        f: File opened with buffering=0
+        length (int): Number of bytes to hash, or -1 to hash until EOF
+    """
+    view = memoryview(bytearray(_HASH_CHUNK_SIZE))
+    remaining = length
+    while remaining != 0:
+        size = _HASH_CHUNK_SIZE if remaining < 0 else min(_HASH_CHUNK_SIZE, remaining)
+        n = f.readinto(view[:size])
+        if not n:
+            break
+        hasher.update(view[:n])
+        if remaining > 0:
+            remaining -= n
+
+
+# Errors from os.copy_file_range that mean "not supported here", not a failed copy
+_COPY_FILE_RANGE_UNSUPPORTED = {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.EPERM}
 
-    # Scan for both uppercase and lowercase extensions
-    upper_files = [f for f in directory.glob(upper_ext) if is_valid_image_file(f)]
-    lower_files = [f for f in directory.glob(lower_ext) if is_valid_image_file(f)]
 
-    # Combine the results
-    return upper_files + lower_files
+def _copy_file_data(src: Path, dst: Path) -> None:
+    """
+    Copy the contents of src to dst, letting the kernel move the bytes.
+
+    On Linux, os.copy_file_range copies in the kernel and turns into a reflink on
+    XFS/Btrfs. Everywhere else (and if copy_file_range is unsupported for this pair of
+    filesystems) shutil.copyfile is used, which already uses fcopyfile on macOS and
+    sendfile on Linux.
+
+    Args:
+        src (Path): Source file path
+        dst (Path): Destination file path (created or truncated)
+    """
+    if hasattr(os, 'copy_file_range'):
+        try:
+            with open(src, 'rb') as fsrc, open(dst, 'wb') as fdst:
+                size = os.fstat(fsrc.fileno()).st_size
+                copied = 0
+                while True:
+                    n = os.copy_file_range(fsrc.fileno(), fdst.fileno(), max(size - copied, 1 << 20))
+                    if n == 0:
+                        break
+                    copied += n
+            # Some kernel/filesystem combinations report success without copying anything
+            if copied == size:
+                return
+        except OSError as e:
+            if e.errno not in _COPY_FILE_RANGE_UNSUPPORTED:
+                raise
+    shutil.copyfile(src, dst)
 
 
 class FileManager:
@@ -66,12 +197,105 @@ class FileManager:
     """
     # Class-level cache for file hashes to avoid recomputing
     _hash_cache = {}
+    # Persistent cache shared across runs (opened lazily on first hash)
+    _persistent_cache: Optional[HashCache] = None
+    # Last camera scan: (monotonic timestamp, DCIM folder fingerprint, files by extension)
+    _camera_scan_cache: Optional[Tuple[float, tuple, Dict[str, List[Path]]]] = None
+    # Original bases of JPGs per folder: {path: (dir mtime_ns, bases)}
+    _final_bases_cache: Dict[str, Tuple[int, FrozenSet[str]]] = {}
 
     @staticmethod
-    def scan_camera_files() -> Dict[str, List[Path]]:
+    def scan_by_extensions(directory: Path, extensions: Iterable[str]) -> Dict[str, List[Path]]:
+        """
+        Scan a directory once and bucket valid files by extension (case-insensitive).
+
+        A single os.scandir pass replaces one glob per extension and case variant,
+        so the directory is only read once regardless of how many types are requested.
+
+        Args:
+            directory (Path): Directory to scan (not recursive)
+            extensions (Iterable[str]): Extensions to collect, e.g. ['.JPG', '.RAF']
+
+        Returns:
+            Dict[str, List[Path]]: Upper-case extensions (with dot) mapped to matching files,
+                                   sorted by filename. Missing directories yield empty lists.
+        """
+        result = {_normalize_extension(ext): [] for ext in extensions}
+
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if '.' not in name:
+                        continue
+                    bucket = result.get('.' + name.rsplit('.', 1)[-1].upper())
+                    if bucket is None or not entry.is_file():
+                        continue
+                    file_path = Path(entry.path)
+                    if is_valid_image_file(file_path):
+                        bucket.append(file_path)
+        except FileNotFoundError:
+            return result
+
+        for files in result.values():
+            files.sort()
+
+        return result
+
+    @classmethod
+    def get_final_bases(cls, final_path: Path) -> FrozenSet[str]:
+        """
+        Get the original filename bases (e.g. 'DSCF0430') of all JPGs in a folder.
+
+        Used to match RAWs against finalized photos. The result is memoized on the folder's
+        mtime, which changes whenever a file is added, removed or renamed, so independent later
+        calls on an unchanged folder cost one stat() instead of a directory walk. The memo only
+        fills once the folder has been unchanged for a few seconds; a step that has just written
+        into the folder should call this once and pass the result on.
+
+        Args:
+            final_path (Path): Folder with finalized JPGs (not recursive)
+
+        Returns:
+            FrozenSet[str]: Original bases as returned by extract_original_base. Empty if the
+                            folder does not exist.
+        """
+        try:
+            dir_mtime = os.stat(final_path).st_mtime_ns
+        except FileNotFoundError:
+            return frozenset()
+
+        key = str(final_path)
+        cached = cls._final_bases_cache.get(key)
+        if cached and cached[0] == dir_mtime:
+            return cached[1]
+
+        bases = set()
+        with os.scandir(final_path) as entries:
+            for entry in entries:
+                name = entry.name
+                if (name[-4:].upper() == '.JPG' and entry.is_file()
+                        and is_valid_image_file(Path(name))):
+                    bases.add(extract_original_base(name))
+
+        result = frozenset(bases)
+        # Only memoize once the mtime is safely in the past: on filesystems with coarse
+        # timestamps (HFS+: 1s) a change within the same tick would otherwise go unnoticed,
+        # and these bases decide which RAWs get deleted
+        if time.time_ns() - dir_mtime > 2_000_000_000:
+            cls._final_bases_cache[key] = (dir_mtime, result)
+        return result
+
+    @classmethod
+    def scan_camera_files(cls) -> Dict[str, List[Path]]:
         """
         Scan all folders in the camera DCIM directory for files and categorize them by extension.
 
+        Listing a camera card is slow, so the result is reused for CAMERA_SCAN_TTL seconds as
+        long as the DCIM folders are unchanged (same folders, same mtimes). Code that deletes
+        files from the camera calls invalidate_camera_scan(), since FAT/exFAT cards do not
+        reliably update folder mtimes.
+
         Returns:
             Dict[str, List[Path]]: Dictionary with extensions as keys and lists of file paths as values.
         """
@@ -81,22 +305,34 @@ class FileManager:
             return result
 
         # Look for all folders in the DCIM directory (like 102_FUJI, 103_FUJI, etc.)
-        for folder in CAMERA_PATH.glob('*_*'):
-            if not folder.is_dir():
+        folders = []
+        for folder in sorted(CAMERA_PATH.glob('*_*')):
+            try:
+                folder_stat = folder.stat()
+            except OSError:
                 continue
+            if stat.S_ISDIR(folder_stat.st_mode):
+                folders.append((folder, folder_stat.st_mtime_ns))
 
-            # Scan each folder for files
-            for file_path in folder.glob('*'):
-                # Skip macOS resource fork files and other system files
-                if not is_valid_image_file(file_path):
-                    continue
+        fingerprint = tuple(folders)
+        cached = cls._camera_scan_cache
+        if cached and cached[1] == fingerprint and time.monotonic() - cached[0] < CAMERA_SCAN_TTL:
+            return {ext: list(paths) for ext, paths in cached[2].items()}
 
-                ext = file_path.suffix.upper()
-                if ext in EXTENSIONS:
-                    result[ext].append(file_path)
+        for folder, _ in folders:
+            # Scan each folder once for all file types
+            folder_files = FileManager.scan_by_extensions(folder, EXTENSIONS)
+            for ext, paths in folder_files.items():
+                result[ext].extend(paths)
 
+        cls._camera_scan_cache = (time.monotonic(), fingerprint, {ext: list(paths) for ext, paths in result.items()})
         return result
 
+    @classmethod
+    def invalidate_camera_scan(cls) -> None:
+        """Forget the cached camera scan (call after deleting or adding files on the camera)."""
+        cls._camera_scan_cache = None
+
     @classmethod
     def is_duplicate(cls, src: Path, dst: Path) -> tuple[bool, str]:
         """
@@ -111,27 +347,87 @@ class FileManager:
                              False otherwise. error_message contains details if an error occurred,
                              empty string otherwise.
         """
-        if not dst.exists():
+        # Stat both sides once; the result serves the size check and the hash cache lookups
+        try:
+            dst_stat = dst.stat()
+        except FileNotFoundError:
             return False, ""
+        except Exception as e:
+            return False, f"Error comparing file sizes: {str(e)}"
 
         # Quick check: if file sizes differ, files cannot be identical
         try:
-            if src.stat().st_size != dst.stat().st_size:
+            src_stat = src.stat()
+            if src_stat.st_size != dst_stat.st_size:
                 return False, ""
         except Exception as e:
             return False, f"Error comparing file sizes: {str(e)}"
 
         # If file sizes match, compare hashes for definitive check
-        src_hash, src_error = cls.get_file_hash(src)
+        # (unchanged files are answered from the cache without reading their contents)
+        src_hash, src_error = cls._hash_with_stat(src, src_stat)
         if src_error:
             return False, src_error
 
-        dst_hash, dst_error = cls.get_file_hash(dst)
+        dst_hash, dst_error = cls._hash_with_stat(dst, dst_stat)
         if dst_error:
             return False, dst_error
 
         return src_hash == dst_hash, ""
 
+    @classmethod
+    def files_equal(cls, a: Path, b: Path, bufsize: int = 64 * 1024,
+                    trust_mtime: bool = False, use_cache: bool = False) -> tuple[bool, str]:
+        """
+        Compare two files byte by byte, stopping at the first difference.
+
+        Cheaper than hashing both files when they are likely to differ: a size mismatch
+        needs no reads at all, and changed files usually differ within the first block
+        (edited metadata sits at the start of a JPEG).
+
+        Args:
+            a (Path): First file
+            b (Path): Second file
+            bufsize (int): Bytes compared per read
+            trust_mtime (bool): Treat same size and modification time as equal without
+                                reading (see is_duplicate for when this is safe)
+            use_cache (bool): Answer from the hash caches without reading when both files
+                              were hashed in their current state (e.g. by safe_copy's
+                              verification on an earlier run)
+
+        Returns:
+            tuple[bool, str]: (are_equal, error_message) - error_message contains details if an
+                             error occurred, empty string otherwise.
+        """
+        try:
+            a_stat = a.stat()
+            b_stat = b.stat()
+        except FileNotFoundError:
+            return False, ""
+        except Exception as e:
+            return False, f"Error comparing file sizes: {str(e)}"
+
+        if a_stat.st_size != b_stat.st_size:
+            return False, ""
+        if trust_mtime and a_stat.st_mtime_ns == b_stat.st_mtime_ns:
+            return True, ""
+        if use_cache:
+            a_hash = cls.cached_hash(a, a_stat)
+            b_hash = cls.cached_hash(b, b_stat) if a_hash else None
+            if a_hash and b_hash:
+                return a_hash == b_hash, ""
+
+        try:
+            with open(a, "rb", buffering=0) as fa, open(b, "rb", buffering=0) as fb:
+                while True:
+                    chunk_a = fa.read(bufsize)
+                    if chunk_a != fb.read(bufsize):
+                        return False, ""
+                    if not chunk_a:
+                        return True, ""
+        except Exception as e:
+            return False, f"Error comparing {a} and {b}: {str(e)}"
+
     @classmethod
     def safe_copy(cls, src: Path, dst: Path) -> tuple[bool, str]:
         """
@@ -160,26 +456,95 @@ class FileManager:
                     # File already exists and is identical, no need to copy
                     return True, ""
 
-            # Copy file with metadata
-            shutil.copy2(src, dst)
-
-            # Verify copy was successful
-            is_dup, error = cls.is_duplicate(src, dst)
-            if error:
-                return False, error
-            if is_dup:
-                return True, ""
-            else:
-                return False, f"Verification failed: copied file does not match source for {src}"
+            # Copy file with metadata (same as shutil.copy2, with an in-kernel data copy) into a
+            # temp file next to dst, so an existing dst is only replaced by a verified copy
+            fd, tmp_name = tempfile.mkstemp(prefix=OUTPUT_TEMP_PREFIX, dir=dst.parent)
+            os.close(fd)
+            tmp_path = Path(tmp_name)
+            try:
+                _copy_file_data(src, tmp_path)
+                shutil.copystat(src, tmp_path)
+
+                # Verify copy was successful (the temp file's hash is not cached under its
+                # throwaway name)
+                src_stat = src.stat()
+                tmp_stat = tmp_path.stat()
+                src_hash, error = cls._hash_with_stat(src, src_stat)
+                if not error:
+                    digest, error = cls._hash_with_stat(tmp_path, tmp_stat, store=False)
+                if error:
+                    return False, error
+                if src_stat.st_size != tmp_stat.st_size or src_hash != digest:
+                    return False, f"Verification failed: copied file does not match source for {src}"
+
+                os.replace(tmp_path, dst)
+            finally:
+                # No-op after the rename; removes the temp file on failure or Ctrl+C
+                tmp_path.unlink(missing_ok=True)
+
+            # Record the verified hash for dst's stat after the rename (which may change
+            # ctime), so the next comparison is answered from the cache
+            cls._store_hash(dst, dst.stat(), True, digest)
+            return True, ""
         except Exception as e:
             return False, f"Error copying {src} to {dst}: {str(e)}"
 
+    @classmethod
+    def _get_persistent_cache(cls) -> HashCache:
+        """Open the persistent hash cache on first use."""
+        if cls._persistent_cache is None:
+            cls._persistent_cache = HashCache()
+        return cls._persistent_cache
+
+    @classmethod
+    def hash_cache_batch(cls):
+        """
+        Context manager grouping the hash cache writes made inside it into one transaction.
+
+        Wrap steps that copy and verify many files, such as a gallery sync.
+        """
+        return cls._get_persistent_cache().batch()
+
+    @classmethod
+    def cached_hash(cls, file_path: Path, file_stat: os.stat_result,
+                    partial: bool = True) -> Optional[str]:
+        """
+        Return the hash of a file if either hash cache has it for its current stat, without reading it.
+
+        Args:
+            file_path (Path): Path to the file
+            file_stat (os.stat_result): Current stat result of the file
+            partial (bool): Whether to look up the partial or the full hash
+
+        Returns:
+            Optional[str]: Cached hexadecimal hash, or None if the file would have to be read
+        """
+        path_key = str(file_path)
+        cache_key = (path_key, file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ctime_ns, partial)
+        if cache_key in cls._hash_cache:
+            return cls._hash_cache[cache_key]
+        mode = _HASH_MODE_PARTIAL if partial else _HASH_MODE_FULL
+        result = cls._get_persistent_cache().get(path_key, mode, file_stat)
+        if result is not None:
+            cls._hash_cache[cache_key] = result
+        return result
+
+    @classmethod
+    def _store_hash(cls, file_path: Path, file_stat: os.stat_result, partial: bool, digest: str) -> None:
+        """Record a file's hash for its current stat in both hash caches."""
+        path_key = str(file_path)
+        cache_key = (path_key, file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ctime_ns, partial)
+        cls._hash_cache[cache_key] = digest
+        mode = _HASH_MODE_PARTIAL if partial else _HASH_MODE_FULL
+        cls._get_persistent_cache().put(path_key, mode, file_stat, digest)
+
     @classmethod
     def get_file_hash(cls, file_path: Path, partial: bool = True) -> tuple[str, str]:
         """
         Generate a hash for a file.
 
-        When partial=True (default), only reads the first and last 1MB of the file
+        Uses xxHash (XXH3, 128 bit): a non-cryptographic hash running at memory bandwidth,
+        which is all duplicate detection needs. When partial=True (default), only reads the first and last 1MB of the file
         for large files (>10MB), which is much faster but still reliable for
         detecting most differences.
 
@@ -192,47 +557,57 @@ class FileManager:
                             error_message contains details if an error occurred, empty string otherwise.
         """
         try:
-            # Get file stats for cache key and size check
             file_stat = file_path.stat()
-            file_size = file_stat.st_size
-
-            # Create a cache key based on file path, size, modification time, and partial flag
-            cache_key = (str(file_path), file_size, file_stat.st_mtime, partial)
-
-            # Check if hash is in cache
-            if cache_key in cls._hash_cache:
-                return cls._hash_cache[cache_key], ""
+        except Exception as e:
+            return "", f"Error generating hash for {file_path}: {str(e)}"
+        return cls._hash_with_stat(file_path, file_stat, partial)
 
-            # Not in cache, compute hash
-            hash_md5 = hashlib.md5()
-
-            # For small files or when partial=False, hash the entire file
-            if not partial or file_size <= 10 * 1024 * 1024:  # 10MB threshold
-                with open(file_path, "rb") as f:
-                    for chunk in iter(lambda: f.read(4096), b""):
-                        hash_md5.update(chunk)
-                result = hash_md5.hexdigest()
-                cls._hash_cache[cache_key] = result
-                return result, ""
+    @classmethod
+    def _hash_with_stat(cls, file_path: Path, file_stat: os.stat_result,
+                        partial: bool = True, store: bool = True) -> tuple[str, str]:
+        """
+        Hash a file whose stat result is already known, consulting both hash caches first.
 
-            # For large files, hash only the first and last 1MB
-            with open(file_path, "rb") as f:
-                # Hash first 1MB
-                for _ in range(256):  # 256 * 4KB = 1MB
-                    chunk = f.read(4096)
-                    if not chunk:
-                        break
-                    hash_md5.update(chunk)
+        Args:
+            file_path (Path): Path to the file
+            file_stat (os.stat_result): Current stat result of the file
+            partial (bool): Whether to use partial hashing for large files
+            store (bool): Whether to cache a newly computed hash (False for temp files)
 
-                # Move to 1MB before the end of file
-                f.seek(max(file_size - 1024 * 1024, 0))
+        Returns:
+            tuple[str, str]: (hash_string, error_message), as for get_file_hash
+        """
+        try:
+            file_size = file_stat.st_size
 
-                # Hash last 1MB
-                for chunk in iter(lambda: f.read(4096), b""):
-                    hash_md5.update(chunk)
+            # Cached by file path, size, modification/change time, and partial flag.
+            # ctime changes on every write, so a file rewritten with its old mtime is re-hashed.
+            result = cls.cached_hash(file_path, file_stat, partial)
+            if result is not None:
+                return result, ""
 
-            result = hash_md5.hexdigest()
-            cls._hash_cache[cache_key] = result
+            # Not in cache, compute hash
+            hasher = xxhash.xxh3_128()
+
+            # Unbuffered: data is read straight into the hash buffer, without the extra
+            # copy through a BufferedReader
+            with open(file_path, "rb", buffering=0) as f:
+                # For small files or when partial=False, hash the entire file
+                if not partial or file_size <= 10 * 1024 * 1024:  # 10MB threshold
+                    _hash_file_range(hasher, f)
+                else:
+                    # For large files, hash only the first and last 1MB
+                    _hash_file_range(hasher, f, 1024 * 1024)
+
+                    # Move to 1MB before the end of file
+                    f.seek(max(file_size - 1024 * 1024, 0))
+
+                    # Hash last 1MB
+                    _hash_file_range(hasher, f)
+
+            result = hasher.hexdigest()
+            if store:
+                cls._store_hash(file_path, file_stat, partial, result)
             return result, ""
         except Exception as e:
             return "", f"Error generating hash for {file_path}: {str(e)}"
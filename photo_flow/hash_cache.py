@@ -0,0 +1,151 @@
+"""
+Persistent file hash cache for the Photo-Flow application.
+
+Hashes are stored in a small SQLite database keyed by file path and hash mode,
+together with the size/mtime/ctime they were computed for. A lookup only hits
+when all of them still match, so modified or replaced files are re-hashed.
+"""
+
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Iterator, Optional
+
+from photo_flow.config import HASH_CACHE_PATH
+
+# Bump when the table layout changes; older databases are dropped and rebuilt
+_SCHEMA_VERSION = 2
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS hashes (
+    path TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    ctime_ns INTEGER NOT NULL,
+    digest TEXT NOT NULL,
+    PRIMARY KEY (path, mode)
+)
+"""
+
+
+class HashCache:
+    """
+    SQLite-backed cache of file digests that survives between workflow runs.
+
+    The cache is best effort: if the database cannot be opened or written, lookups
+    miss and files are simply hashed again.
+    """
+
+    def __init__(self, db_path: Path = HASH_CACHE_PATH):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            db_path (Path): Location of the SQLite database file
+        """
+        self._lock = threading.Lock()
+        self._conn = self._connect(db_path)
+
+    @staticmethod
+    def _connect(db_path: Path) -> Optional[sqlite3.Connection]:
+        """Open the database, recreating it if it is corrupt. Returns None if unusable."""
+        for attempt in range(2):
+            try:
+                db_path.parent.mkdir(parents=True, exist_ok=True)
+                # Autocommit; the lock below serializes access from worker threads
+                conn = sqlite3.connect(str(db_path), isolation_level=None, check_same_thread=False)
+                # A lost write only costs a re-hash, so skip fsync on every insert
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute("PRAGMA synchronous=OFF")
+                if conn.execute("PRAGMA user_version").fetchone()[0] != _SCHEMA_VERSION:
+                    conn.execute("DROP TABLE IF EXISTS hashes")
+                    conn.execute(f"PRAGMA user_version={_SCHEMA_VERSION}")
+                conn.execute(_SCHEMA)
+                return conn
+            except sqlite3.DatabaseError:
+                if attempt == 0:
+                    try:
+                        db_path.unlink()
+                    except OSError:
+                        return None
+            except OSError:
+                return None
+        return None
+
+    def get(self, path: str, mode: str, file_stat: os.stat_result) -> Optional[str]:
+        """
+        Look up the digest of a file if it has not changed since it was cached.
+
+        Args:
+            path (str): Absolute or workflow-relative file path
+            mode (str): Hash algorithm and coverage, e.g. 'xxh3_128:partial'
+            file_stat (os.stat_result): Current stat result of the file
+
+        Returns:
+            Optional[str]: Cached hex digest, or None on a miss
+        """
+        if self._conn is None:
+            return None
+        try:
+            with self._lock:
+                row = self._conn.execute(
+                    "SELECT digest FROM hashes WHERE path = ? AND mode = ? "
+                    "AND size = ? AND mtime_ns = ? AND ctime_ns = ?",
+                    (path, mode, file_stat.st_size, file_stat.st_mtime_ns, file_stat.st_ctime_ns),
+                ).fetchone()
+        except sqlite3.Error:
+            return None
+        return row[0] if row else None
+
+    def put(self, path: str, mode: str, file_stat: os.stat_result, digest: str) -> None:
+        """
+        Store the digest of a file, replacing any entry for an older version of it.
+
+        Args:
+            path (str): Absolute or workflow-relative file path
+            mode (str): Hash algorithm and coverage, e.g. 'xxh3_128:partial'
+            file_stat (os.stat_result): Stat result the digest was computed for
+            digest (str): Hex digest of the file
+        """
+        if self._conn is None:
+            return
+        try:
+            with self._lock:
+                self._conn.execute(
+                    "INSERT OR REPLACE INTO hashes (path, mode, size, mtime_ns, ctime_ns, digest) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (path, mode, file_stat.st_size, file_stat.st_mtime_ns,
+                     file_stat.st_ctime_ns, digest),
+                )
+        except sqlite3.Error:
+            pass
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """
+        Group all writes made inside the block into a single transaction.
+
+        Used around whole workflow steps, so hundreds of put() calls cost one commit
+        instead of one each. Nested or concurrent batches join the outer transaction.
+        """
+        began = False
+        if self._conn is not None:
+            try:
+                with self._lock:
+                    if not self._conn.in_transaction:
+                        self._conn.execute("BEGIN")
+                        began = True
+            except sqlite3.Error:
+                pass
+        try:
+            yield
+        finally:
+            if began:
+                try:
+                    with self._lock:
+                        self._conn.execute("COMMIT")
+                except sqlite3.Error:
+                    pass
@@ -12,6 +12,8 @@ import tempfile
 import shutil
 
 from photo_flow.config import CLARITY_ADJUSTMENT
+# Name prefix of temp files created next to the output (temp_dir), shared with safe_copy
+from photo_flow.file_manager import OUTPUT_TEMP_PREFIX
 
 
 class ImageProcessor:
@@ -80,7 +82,8 @@ class ImageProcessor:
 
     @staticmethod
     def compress_jpeg_safe(input_path: Path, output_path: Path = None, max_width: int = 5200,
-                          max_height: int = 3467, quality: int = 92) -> tuple[bool, str]:
+                          max_height: int = 3467, quality: int = 92,
+                          temp_dir: Path = None) -> tuple[bool, str]:
         """
         Safely compress and resize a JPEG image while preserving ALL metadata.
 
@@ -100,6 +103,10 @@ class ImageProcessor:
             max_width (int): Maximum width in pixels (default: 5200, 83% of X-T4 native)
             max_height (int): Maximum height in pixels (default: 3467, 83% of X-T4 native)
             quality (int): JPEG quality 1-100 (default: 92, optimal quality/size balance)
+            temp_dir (Path): Directory for the temporary file (defaults to the system temp dir).
+                             Pass the output's directory to make the final replace an atomic
+                             rename; the temp file is then named OUTPUT_TEMP_PREFIX + '*' so
+                             scans and backups ignore it like any other macOS '._' file.
 
         Returns:
             tuple[bool, str]: (success, error_message)
@@ -113,7 +120,9 @@ class ImageProcessor:
 
         try:
             # Create temporary file for compressed version
-            with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as tmp:
+            temp_prefix = OUTPUT_TEMP_PREFIX if temp_dir is not None else 'tmp'
+            with tempfile.NamedTemporaryFile(prefix=temp_prefix, suffix='.jpg',
+                                             dir=temp_dir, delete=False) as tmp:
                 tmp_path = Path(tmp.name)
 
             # Open and process image
@@ -199,4 +208,9 @@ class ImageProcessor:
             # Clean up temp file on any other error
             if 'tmp_path' in locals():
                 tmp_path.unlink(missing_ok=True)
-            return False, f"Error compressing JPEG {input_path}: {e}"
\ No newline at end of file
+            return False, f"Error compressing JPEG {input_path}: {e}"
+        except BaseException:
+            # Ctrl+C: don't leave the temp file behind (it may live next to the output)
+            if 'tmp_path' in locals():
+                tmp_path.unlink(missing_ok=True)
+            raise
\ No newline at end of file
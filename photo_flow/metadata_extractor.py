@@ -9,10 +9,10 @@ from pathlib import Path
 from datetime import datetime
 from typing import Dict, Any, Optional, Union
 import os
-import json
 
 from PIL import Image
 import piexif
+import orjson
 
 from photo_flow.file_manager import is_valid_image_file
 
@@ -322,9 +322,13 @@ class MetadataExtractor:
             # Create parent directory if it doesn't exist
             output_path.parent.mkdir(parents=True, exist_ok=True)
 
-            # Write JSON to file
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(metadata_json, f, indent=2)
+            # Write JSON to file (orjson encodes straight to UTF-8 bytes; default=str covers
+            # values such as EXIF rationals or bytes that have no JSON type)
+            output_path.write_bytes(orjson.dumps(
+                metadata_json,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                default=str
+            ))
 
             return True
         except Exception as e:
@@ -3,23 +3,44 @@ Workflow management for the Photo-Flow application.
 
 This module provides the main workflow logic for the application.
 """
+import atexit
+import fnmatch
+import functools
 import logging
 import os
+import re
+import shlex
 import shutil
+import socket
 import tempfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
 from pathlib import Path
 import subprocess
-from typing import Dict, List
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
+
+import orjson
+import xxhash
+from rich.markup import escape
 
 from photo_flow.config import (
     CAMERA_PATH, STAGING_PATH, RAWS_PATH, FINAL_PATH, SSD_PATH, GALLERY_PATH,
-    HOMELAB_USER, HOMELAB_HOST, HOMELAB_SSD_FINAL_PATH, HOMELAB_HDD_RAWS_PATH,
-    HOMELAB_HDD_VIDEOS_PATH, HOMELAB_TRASH_PATH, RSYNC_EXCLUDE_PATTERNS,
-    RSYNC_SSH_CMD
+    HOMELAB_USER, HOMELAB_HOST, HOMELAB_SSH_PORT, HOMELAB_PROBE_TIMEOUT, HOMELAB_SSD_FINAL_PATH, HOMELAB_HDD_RAWS_PATH,
+    HOMELAB_HDD_VIDEOS_PATH, HOMELAB_TRASH_PATH, HOMELAB_BULK_THRESHOLD, RSYNC_EXCLUDE_PATTERNS,
+    RSYNC_SSH_CMD, RSYNC_MAX_SHARDS, RSYNC_PARTIAL_DIR, RSYNC_IO_TIMEOUT,
+    RSYNC_WHOLE_FILE, GALLERY_RSYNC_SKIP_COMPRESS, SSH_CONTROL_PATH,
+    RSYNC_PREALLOCATE, PARALLEL_IMPORT, GALLERY_SSH_TARGET, GALLERY_REMOTE_PATH,
+    GALLERY_SSH_CONTROL_PERSIST, FINALIZE_WORKERS, BATCH_IO_WORKERS, GALLERY_RSYNC_WORKERS,
+    GALLERY_DIST_HASH_PATH, BACKUP_MANIFEST_DIR, BACKUP_FULL_SCAN_DAYS
+)
+from photo_flow.batch_io import batch_copy, batch_is_duplicate, batch_unlink
+from photo_flow.file_manager import (
+    FileManager, count_at_least, is_valid_image_file, scan_for_images, scan_for_images_iter
 )
-from photo_flow.file_manager import FileManager, is_valid_image_file, scan_for_images
-from photo_flow.image_processor import ImageProcessor
+from photo_flow.image_processor import OUTPUT_TEMP_PREFIX, ImageProcessor
 from photo_flow.metadata_extractor import MetadataExtractor
 from photo_flow.console_utils import console, create_progress, show_status, info, warning, error
 from photo_flow.immich_client import trigger_immich_scan
@@ -27,6 +48,288 @@ from photo_flow.timestamp_renamer import generate_timestamped_filename, extract_
 
 logger = logging.getLogger(__name__)
 
+# Resolved once per process: $PATH does not change while photoflow runs, and passing the
+# absolute path to subprocess skips the exec-time $PATH search for every rsync child
+_RSYNC_BIN = shutil.which("rsync")
+
+# rsync options shared by every backup invocation, regardless of mode or shard
+_RSYNC_BASE_FLAGS = ("-a", "--partial", f"--timeout={RSYNC_IO_TIMEOUT}")
+
+# Lines of rsync --stats output worth showing after a dry run
+_RSYNC_DRY_RUN_STAT_LINES = (
+    "Number of regular files transferred",  # rsync >= 3.1
+    "Number of files transferred",          # older rsync
+    "Total transferred file size",
+)
+
+# Marker file in each remote backup folder, written after the first complete sync
+_INITIAL_SYNC_SENTINEL = ".photoflow_initial_done"
+
+# Below this many images, metadata is extracted in-process (worker startup would dominate)
+_PARALLEL_METADATA_MIN_FILES = 32
+
+# Multipliers for rsync's human-readable transfer rates (e.g. "12.34MB/s")
+_RATE_UNITS = {'B': 1, 'kB': 1024, 'KB': 1024, 'MB': 1024 ** 2, 'GB': 1024 ** 3, 'TB': 1024 ** 4}
+
+
+def _homelab_reachable() -> bool:
+    """Probe the homelab's SSH port with a short TCP connect (fails in seconds when offline)."""
+    try:
+        with socket.create_connection((HOMELAB_HOST, HOMELAB_SSH_PORT), timeout=HOMELAB_PROBE_TIMEOUT):
+            return True
+    except OSError:
+        return False
+
+
+@functools.lru_cache(maxsize=None)
+def _rsync_endpoints(source_path: Path, remote_dest: Path) -> Tuple[str, str]:
+    """Build the rsync (source, remote) arguments once per backup target."""
+    src = os.fspath(source_path) + "/"  # trailing slash = sync contents
+    remote = f"{HOMELAB_USER}@{HOMELAB_HOST}:{os.fspath(remote_dest)}"
+    return src, remote
+
+
+@functools.lru_cache(maxsize=1)
+def _rsync_exclude_file() -> str:
+    """
+    Write RSYNC_EXCLUDE_PATTERNS to a temp file once per process for --exclude-from.
+
+    Keeps every rsync argv short (one option instead of two per pattern, per shard).
+    The file is removed when the process exits.
+    """
+    with tempfile.NamedTemporaryFile(
+        mode='w', prefix="photoflow-exclude-", suffix='.txt', delete=False
+    ) as exclude_file:
+        exclude_file.write("".join(f"{pattern}\n" for pattern in RSYNC_EXCLUDE_PATTERNS))
+    atexit.register(Path(exclude_file.name).unlink, missing_ok=True)
+    return exclude_file.name
+
+
+@functools.lru_cache(maxsize=1)
+def _ensure_ssh_control_dir() -> None:
+    """
+    Create the directory for SSH_CONTROL_PATH sockets once per process.
+
+    ssh does not create it itself, and with ControlMaster=auto a missing directory makes
+    every connection fail rather than fall back to an unshared one.
+    """
+    try:
+        Path(os.path.expanduser(SSH_CONTROL_PATH)).parent.mkdir(mode=0o700, exist_ok=True)
+    except OSError as e:
+        logger.warning("Could not create SSH control socket directory: %s", e)
+
+
+def _dist_fingerprint(dist_path: Path) -> str:
+    """
+    Hash the contents of a gallery build, together with the server it is pushed to.
+
+    npm rewrites every file on each build, so the fingerprint covers relative paths and file
+    contents rather than mtimes. The build was just written, so it is read from the page cache.
+
+    Args:
+        dist_path (Path): Build output directory
+
+    Returns:
+        str: Hex digest, or an empty string if the build could not be read
+    """
+    if not dist_path.is_dir():
+        return ""
+    hasher = xxhash.xxh3_128(f"{GALLERY_SSH_TARGET}:{GALLERY_REMOTE_PATH}".encode())
+    try:
+        for root, dirs, files in os.walk(dist_path):
+            dirs.sort()
+            for name in sorted(files):
+                file_path = os.path.join(root, name)
+                hasher.update(os.path.relpath(file_path, dist_path).encode() + b"\0")
+                with open(file_path, "rb", buffering=0) as f:
+                    while chunk := f.read(1024 * 1024):
+                        hasher.update(chunk)
+                hasher.update(b"\0")
+    except OSError:
+        return ""
+    return hasher.hexdigest()
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_npm_env(project_path: Path) -> Tuple[Optional[str], Optional[Dict[str, str]]]:
+    """
+    Find npm for building the gallery, once per process.
+
+    The Node version pinned in .nvmrc is used when nvm has it installed (its bin directory is
+    put first on PATH); otherwise npm is taken from the default PATH.
+
+    Args:
+        project_path (Path): Gallery project directory (containing package.json and .nvmrc)
+
+    Returns:
+        Tuple[Optional[str], Optional[Dict[str, str]]]: (absolute npm path or None if npm is not
+        installed, environment for the build or None to inherit the current one)
+    """
+    try:
+        node_version = (project_path / ".nvmrc").read_text().strip().lstrip('v')
+    except OSError:
+        node_version = ""
+
+    if node_version:
+        node_version_path = os.path.expanduser(f"~/.nvm/versions/node/v{node_version}/bin")
+        npm_bin = shutil.which("npm", path=node_version_path)
+        if npm_bin:
+            env = os.environ.copy()
+            env["PATH"] = f"{node_version_path}:{env['PATH']}"
+            return npm_bin, env
+
+    return shutil.which("npm"), None
+
+
+def _backup_manifest_path(source_name: str) -> Path:
+    """Location of the manifest of the last successful backup of source_name."""
+    return BACKUP_MANIFEST_DIR / f"{source_name}.json"
+
+
+def _load_backup_manifest(source_name: str, remote_dest: Path) -> Tuple[Optional[Dict[str, List[int]]], float]:
+    """
+    Load what the last successful backup of source_name to remote_dest sent.
+
+    Returns:
+        Tuple[Optional[Dict[str, List[int]]], float]: (relative path -> [size, mtime_ns], time of
+        the last full comparison). The files are None, with the current time, when a full
+        comparison is due: no manifest, another destination, or older than BACKUP_FULL_SCAN_DAYS.
+    """
+    now = time.time()
+    try:
+        manifest = orjson.loads(_backup_manifest_path(source_name).read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return None, now
+    if not isinstance(manifest, dict) or manifest.get('remote') != os.fspath(remote_dest):
+        return None, now
+    full_scan_at = manifest.get('saved_at', 0)
+    files = manifest.get('files')
+    if now - full_scan_at > BACKUP_FULL_SCAN_DAYS * 86400 or not isinstance(files, dict):
+        return None, now
+    return files, full_scan_at
+
+
+def _save_backup_manifest(source_name: str, remote_dest: Path, files: Dict[str, List[int]],
+                          full_scan_at: float) -> None:
+    """Atomically record the files a successful backup covered (best effort)."""
+    path = _backup_manifest_path(source_name)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = path.with_name(path.name + ".tmp")
+        temp_path.write_bytes(orjson.dumps(
+            {'remote': os.fspath(remote_dest), 'saved_at': full_scan_at, 'files': files}
+        ))
+        os.replace(temp_path, path)
+    except OSError as e:
+        logger.warning("Could not save backup manifest %s: %s", path, e)
+
+
+# Lines of output kept from streamed commands for error reports
+_STREAMED_OUTPUT_TAIL_LINES = 50
+
+
+def _run_streamed(cmd: List[str], cwd: Optional[Path] = None, env: Optional[Dict[str, str]] = None,
+                  on_line: Optional[Callable[[str], None]] = None) -> subprocess.CompletedProcess:
+    """
+    Run a command, handing each line of its output to on_line as it is printed.
+
+    Unlike capture_output, memory stays bounded for chatty commands (an npm build log):
+    only the last _STREAMED_OUTPUT_TAIL_LINES lines are kept for error reporting.
+
+    Args:
+        cmd (List[str]): Command and arguments
+        cwd (Path, optional): Working directory
+        env (Dict[str, str], optional): Environment (defaults to the current one)
+        on_line (Callable, optional): Called with each output line (stdout and stderr merged)
+
+    Returns:
+        subprocess.CompletedProcess: Exit code, with the output tail as stdout (stderr is None)
+    """
+    tail = deque(maxlen=_STREAMED_OUTPUT_TAIL_LINES)
+    with subprocess.Popen(cmd, cwd=cwd, env=env, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE,
+                          stderr=subprocess.STDOUT, text=True, bufsize=1) as process:
+        for line in process.stdout:
+            line = line.rstrip()
+            tail.append(line)
+            if on_line:
+                on_line(line)
+    return subprocess.CompletedProcess(cmd, process.returncode, stdout="\n".join(tail), stderr=None)
+
+
+def _status_updater(status, message: str) -> Callable[[str], None]:
+    """Build an on_line callback that shows the latest output line next to a spinner message."""
+    def update(line: str) -> None:
+        if line:
+            status.update(f"[bold blue]{message}[/bold blue] [dim]{escape(line[:80])}[/dim]")
+    return update
+
+
+def _parse_rsync_version(version_output: str) -> Tuple[int, int, int]:
+    """Parse "rsync  version 3.2.7" or "rsync version 2.6.9" into (major, minor, patch)."""
+    match = re.search(r'version (\d+)\.(\d+)\.?(\d*)', version_output)
+    if not match:
+        return (0, 0, 0)
+    major, minor, patch = match.groups()
+    return (int(major), int(minor), int(patch) if patch else 0)
+
+
+def _list_raws(directory: Path) -> List[Path]:
+    """
+    List the RAFs directly in directory, matching the '.RAF' suffix exactly (like glob('*.RAF')).
+
+    Unlike scan_for_images this is case-sensitive on purpose: the result feeds orphan
+    deletion, which must not widen to lowercase '.raf' files the camera never writes.
+    One os.scandir pass; Path objects are only created for matches.
+    """
+    with os.scandir(directory) as entries:
+        return [
+            Path(entry.path) for entry in entries
+            if entry.name.endswith('.RAF') and not entry.name.startswith('.')
+            and entry.is_file() and is_valid_image_file(Path(entry.name))
+        ]
+
+
+def _remove_stale_temp_files(directory: Path) -> None:
+    """
+    Delete OUTPUT_TEMP_PREFIX temp files left in directory by a crash or killed run.
+
+    Normal failures and Ctrl+C already clean up after themselves. A missing directory is ignored.
+    """
+    try:
+        stale_temps = list(directory.glob(f"{OUTPUT_TEMP_PREFIX}*"))
+    except OSError:
+        return
+    for stale_temp in stale_temps:
+        try:
+            stale_temp.unlink()
+        except OSError as e:
+            logger.warning("Could not remove stale temp file %s: %s", stale_temp, e)
+
+
+def _is_rsync_excluded(name: str) -> bool:
+    """Check if a file or directory name matches one of the rsync exclude patterns."""
+    return any(fnmatch.fnmatchcase(name, pattern) for pattern in RSYNC_EXCLUDE_PATTERNS)
+
+
+def _parse_rate(rate: str) -> float:
+    """Convert an rsync rate string like '12.34MB/s' to bytes per second (0 if unparsable)."""
+    number = rate.rstrip('/s')
+    for unit in sorted(_RATE_UNITS, key=len, reverse=True):
+        if number.endswith(unit):
+            try:
+                return float(number[:-len(unit)]) * _RATE_UNITS[unit]
+            except ValueError:
+                return 0.0
+    return 0.0
+
+
+def _format_rate(bytes_per_second: float) -> str:
+    """Format bytes per second the way rsync does (e.g. '12.34MB/s')."""
+    for unit in ('GB', 'MB', 'kB'):
+        if bytes_per_second >= _RATE_UNITS[unit]:
+            return f"{bytes_per_second / _RATE_UNITS[unit]:.2f}{unit}/s"
+    return f"{bytes_per_second:.2f}B/s" if bytes_per_second else "--"
+
 
 @dataclass
 class StatusReport:
@@ -167,121 +470,189 @@ class PhotoWorkflow:
             info("No new files to import")
             return {'videos': 0, 'photos': 0, 'raws': 0, 'skipped': 0, 'errors': 0}
 
-        all_files = []
-        file_destinations = []
-        file_types = []
-        delete_flags = []
-
-        # Prepare all files for batch processing
-        for mov in mov_files:
-            all_files.append(mov)
-            file_destinations.append(SSD_PATH)
-            file_types.append("video")
-            delete_flags.append(True)
-
-        for jpg in jpg_files:
-            all_files.append(jpg)
-            file_destinations.append(STAGING_PATH)
-            file_types.append("photo")
-            delete_flags.append(True)
-
-        for raf in raf_files:
-            all_files.append(raf)
-            file_destinations.append(RAWS_PATH)
-            file_types.append("RAW")
-            delete_flags.append(True)
-
-        mov_count = jpg_count = raf_count = 0
-        mov_skip = jpg_skip = raf_skip = 0
-        errors = 0
+        # Remove copy temp files a crashed or killed import left in the destinations
+        if not dry_run:
+            for dest in (SSD_PATH, STAGING_PATH, RAWS_PATH):
+                _remove_stale_temp_files(dest)
 
         # Track existing filenames per destination for collision detection
+        # (plain name listings, no Path object per entry)
         existing_names = {
-            SSD_PATH: {f.name for f in SSD_PATH.glob('*')} if SSD_PATH.exists() else set(),
-            STAGING_PATH: {f.name for f in STAGING_PATH.glob('*')} if STAGING_PATH.exists() else set(),
-            RAWS_PATH: {f.name for f in RAWS_PATH.glob('*')} if RAWS_PATH.exists() else set(),
+            SSD_PATH: set(os.listdir(SSD_PATH)) if SSD_PATH.exists() else set(),
+            STAGING_PATH: set(os.listdir(STAGING_PATH)) if STAGING_PATH.exists() else set(),
+            RAWS_PATH: set(os.listdir(RAWS_PATH)) if RAWS_PATH.exists() else set(),
         }
 
+        # Each file type goes to its own destination and is imported independently
+        imports = [
+            (mov_files, SSD_PATH, "video"),
+            (jpg_files, STAGING_PATH, "photo"),
+            (raf_files, RAWS_PATH, "RAW"),
+        ]
+
+        # Group destinations by device: destinations on the same disk (RAWs and Videos both
+        # live on the external SSD) run one after another, distinct disks run in parallel
+        device_groups = {}
+        for files_to_import, dest, ftype in imports:
+            if not files_to_import:
+                continue
+            try:
+                device = os.stat(dest).st_dev
+            except OSError:
+                device = dest
+            device_groups.setdefault(device, []).append((files_to_import, dest, ftype))
+
+        results = {}
+        stop_event = threading.Event()
+
+        # Files are deleted from the camera as they are imported (even if interrupted)
+        self.file_manager.invalidate_camera_scan()
+
         with create_progress() as progress:
             task = progress.add_task(
                 f"[cyan]Importing {total_files} files from camera",
                 total=total_files
             )
 
-            for file_path, dest, ftype, should_delete in zip(all_files, file_destinations, file_types, delete_flags):
-                # Generate timestamped filename
-                new_filename, ts_error = generate_timestamped_filename(file_path, existing_names[dest])
+            def import_group(group) -> None:
+                for files_to_import, dest, ftype in group:
+                    results[ftype] = self._import_to_destination(
+                        files_to_import, dest, existing_names[dest], dry_run, progress, task, stop_event
+                    )
+
+            groups = list(device_groups.values())
+            if PARALLEL_IMPORT and len(groups) > 1:
+                executor = ThreadPoolExecutor(max_workers=len(groups))
+                try:
+                    for future in [executor.submit(import_group, group) for group in groups]:
+                        future.result()
+                except BaseException:
+                    # Ctrl+C only reaches the main thread: tell the workers to stop
+                    # after the file they are currently copying
+                    stop_event.set()
+                    raise
+                finally:
+                    executor.shutdown(wait=True, cancel_futures=True)
+            else:
+                for group in groups:
+                    import_group(group)
+
+        empty = {'copied': 0, 'skipped': 0, 'errors': 0}
+        mov_stats = results.get("video", empty)
+        jpg_stats = results.get("photo", empty)
+        raf_stats = results.get("RAW", empty)
+
+        return {
+            'videos': mov_stats['copied'],
+            'photos': jpg_stats['copied'],
+            'raws': raf_stats['copied'],
+            'skipped': mov_stats['skipped'] + jpg_stats['skipped'] + raf_stats['skipped'],
+            'errors': mov_stats['errors'] + jpg_stats['errors'] + raf_stats['errors']
+        }
+
+    def _import_to_destination(self, files: List[Path], dest: Path, existing_names: set,
+                               dry_run: bool, progress, task, stop_event=None) -> Dict[str, int]:
+        """
+        Import camera files of one type into a destination folder.
+
+        Files are renamed with their capture timestamp, skipped (and deleted from the camera)
+        if an identical copy already exists, and deleted from the camera after a verified copy.
+        Only touches state belonging to `dest`, so different destinations can run in parallel.
+
+        Args:
+            files: Camera files to import
+            dest: Destination directory
+            existing_names: Filenames already in dest (updated with newly imported names)
+            dry_run: If True, only count files without copying
+            progress: Rich Progress instance to advance
+            task: Progress task ID
+            stop_event: Optional threading.Event; when set, stops before the next chunk of files
+
+        Returns:
+            Dict with 'copied', 'skipped', 'errors' counts
+        """
+        stats = {'copied': 0, 'skipped': 0, 'errors': 0}
+
+        # Index existing files by original base once, instead of re-listing dest and
+        # re-parsing every name for each imported file
+        existing_by_base = {}
+        for name in existing_names:
+            existing_by_base.setdefault(extract_original_base(name), []).append(dest / name)
+
+        # Files are imported in chunks: each chunk is copied as one concurrent batch, and a
+        # stop request takes effect once the chunk in flight has finished
+        chunk_size = BATCH_IO_WORKERS * 4
+        for start in range(0, len(files), chunk_size):
+            if stop_event is not None and stop_event.is_set():
+                break
+
+            chunk = files[start:start + chunk_size]
+
+            # Check the whole chunk for duplicates (by content, not just name) against existing
+            # files with the same original base; the hashes are read concurrently
+            candidates = [] if dry_run else [
+                (file_path, existing)
+                for file_path in chunk
+                for existing in existing_by_base.get(extract_original_base(file_path.name), ())
+            ]
+            duplicates = {
+                file_path
+                for (file_path, _), (is_dup, _) in zip(candidates, batch_is_duplicate(candidates))
+                if is_dup
+            }
+
+            # Pass 1: duplicates are only deleted from the camera (a verified backup exists),
+            # everything else gets a timestamped name and is queued for copying
+            to_copy = []
+            to_delete = []
+            for file_path in chunk:
+                if file_path in duplicates:
+                    stats['skipped'] += 1
+                    to_delete.append(file_path)
+                    progress.advance(task)
+                    continue
+
+                # Generate timestamped filename; reserving it right away keeps the names of
+                # files later in the same chunk distinct
+                new_filename, ts_error = generate_timestamped_filename(file_path, existing_names)
                 if ts_error:
-                    logger.warning(f"Using original name: {ts_error}")
+                    logger.warning("Using original name: %s", ts_error)
+                existing_names.add(new_filename)
 
                 if dry_run:
-                    if ftype == "video":
-                        mov_count += 1
-                    elif ftype == "photo":
-                        jpg_count += 1
-                    else:
-                        raf_count += 1
-                    existing_names[dest].add(new_filename)
+                    stats['copied'] += 1
                     progress.advance(task)
                     continue
 
-                dst_path = dest / new_filename
-
-                # Check for duplicates (by content, not just name)
-                # First check if a file with the original base exists
-                is_dup = False
-                orig_base = extract_original_base(file_path.name)
-                for existing in dest.glob('*'):
-                    if extract_original_base(existing.name) == orig_base:
-                        dup_check, _ = self.file_manager.is_duplicate(file_path, existing)
-                        if dup_check:
-                            is_dup = True
-                            break
-
-                if is_dup:
-                    if ftype == "video":
-                        mov_skip += 1
-                    elif ftype == "photo":
-                        jpg_skip += 1
-                    else:
-                        raf_skip += 1
-                    # Delete from camera since verified backup exists
-                    if should_delete:
-                        try:
-                            file_path.unlink()
-                        except Exception as e:
-                            error(f"Failed to delete duplicate {file_path.name}: {e}")
-                            errors += 1
-                else:
-                    copy_success, copy_error = self.file_manager.safe_copy(file_path, dst_path)
-                    if copy_success:
-                        existing_names[dest].add(new_filename)
-                        if ftype == "video":
-                            mov_count += 1
-                        elif ftype == "photo":
-                            jpg_count += 1
-                        else:
-                            raf_count += 1
-
-                        if should_delete:
-                            try:
-                                file_path.unlink()
-                            except Exception as e:
-                                error(f"Failed to delete original {file_path.name}: {e}")
-                                errors += 1
-                    else:
-                        error(f"Failed to copy {file_path.name}: {copy_error}")
-                        errors += 1
+                to_copy.append((file_path, dest / new_filename))
+
+            # Pass 2: copy the chunk as one batch, several files in flight at once
+            targets = dict(to_copy)
 
+            def on_copied(file_path: Path, copy_success: bool, copy_error: str) -> None:
+                dst_path = targets[file_path]
+                if copy_success:
+                    existing_by_base.setdefault(extract_original_base(file_path.name), []).append(dst_path)
+                    stats['copied'] += 1
+                    to_delete.append(file_path)
+                else:
+                    existing_names.discard(dst_path.name)
+                    error(f"Failed to copy {file_path.name}: {copy_error}")
+                    stats['errors'] += 1
                 progress.advance(task)
 
-        return {
-            'videos': mov_count,
-            'photos': jpg_count,
-            'raws': raf_count,
-            'skipped': mov_skip + jpg_skip + raf_skip,
-            'errors': errors
-        }
+            batch_copy(to_copy, on_done=on_copied)
+
+            # Pass 3: delete the camera originals that now have a verified copy
+            def on_deleted(file_path: Path, deleted: bool, delete_error: str) -> None:
+                if not deleted:
+                    label = "duplicate" if file_path in duplicates else "original"
+                    error(f"Failed to delete {label} {file_path.name}: {delete_error}")
+                    stats['errors'] += 1
+
+            batch_unlink(to_delete, on_done=on_deleted)
+
+        return stats
 
     def finalize_staging(self, dry_run: bool = False, progress_callback=None) -> Dict[str, int]:
         """
@@ -321,6 +692,9 @@ class PhotoWorkflow:
         if not dry_run:
             FINAL_PATH.mkdir(parents=True, exist_ok=True)
 
+            # Remove compression temp files left behind by a crash or killed run
+            _remove_stale_temp_files(FINAL_PATH)
+
         # Step 1: Compress and move staging files to Final
         with create_progress() as progress:
             task = progress.add_task(
@@ -328,107 +702,120 @@ class PhotoWorkflow:
                 total=len(staging_files)
             )
 
-            for staging_file in staging_files:
-                final_path = FINAL_PATH / staging_file.name
-
-                # Check for duplicates
-                if final_path.exists():
-                    is_dup, _ = self.file_manager.is_duplicate(staging_file, final_path)
-                    if is_dup:
-                        stats['skipped'] += 1
-                        progress.advance(task)
-                        continue
-
-                if dry_run:
-                    stats['moved'] += 1
-                    stats['compressed'] += 1
-                else:
-                    # ATOMIC: Compress → Copy → Delete
-                    temp_compressed = None
+            def finish(staging_file: Path, compress_success: bool, compress_error: str) -> None:
+                """Delete the staging original once its compressed copy is in Final."""
+                if compress_success:
                     try:
-                        with tempfile.NamedTemporaryFile(suffix='.jpg', delete=False) as tmp:
-                            temp_compressed = Path(tmp.name)
+                        staging_file.unlink()
+                        stats['moved'] += 1
+                        stats['compressed'] += 1
+                    except Exception as e:
+                        error(f"Failed to delete staging file {staging_file.name}: {e}")
+                        stats['errors'] += 1
+                else:
+                    error(f"Failed to compress {staging_file.name}: {compress_error}")
+                    stats['errors'] += 1
+                progress.advance(task)
 
-                        compress_success, compress_error = self.image_processor.compress_jpeg_safe(
-                            staging_file, output_path=temp_compressed
-                        )
+            # Pipeline: worker threads compress (Pillow releases the GIL while decoding,
+            # resizing and encoding; exiftool runs as a separate process) while this thread
+            # finishes completed files in order. At most 2x workers photos are in flight.
+            workers = max(1, min(FINALIZE_WORKERS, os.cpu_count() or 1))
+            executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 and not dry_run else None
+            in_flight = deque()
 
-                        if not compress_success:
-                            error(f"Failed to compress {staging_file.name}: {compress_error}")
-                            stats['errors'] += 1
+            try:
+                for staging_file in staging_files:
+                    final_path = FINAL_PATH / staging_file.name
+
+                    # Check for duplicates
+                    if final_path.exists():
+                        is_dup, _ = self.file_manager.is_duplicate(staging_file, final_path)
+                        if is_dup:
+                            stats['skipped'] += 1
                             progress.advance(task)
                             continue
 
-                        copy_success, copy_error = self.file_manager.safe_copy(temp_compressed, final_path)
-
-                        if copy_success:
-                            try:
-                                staging_file.unlink()
-                                stats['moved'] += 1
-                                stats['compressed'] += 1
-                            except Exception as e:
-                                error(f"Failed to delete staging file {staging_file.name}: {e}")
-                                stats['errors'] += 1
-                        else:
-                            error(f"Failed to copy {staging_file.name} to Final: {copy_error}")
-                            stats['errors'] += 1
+                    if dry_run:
+                        stats['moved'] += 1
+                        stats['compressed'] += 1
+                        progress.advance(task)
+                        continue
 
-                    finally:
-                        if temp_compressed and temp_compressed.exists():
-                            try:
-                                temp_compressed.unlink()
-                            except Exception:
-                                pass
+                    # ATOMIC: Compress into Final → Delete
+                    # The compressed file is written to a temp file inside FINAL_PATH and renamed
+                    # over final_path, so each photo is written once and Final never contains a
+                    # partial or uncompressed file
+                    if executor is None:
+                        finish(staging_file, *self.image_processor.compress_jpeg_safe(
+                            staging_file, output_path=final_path, temp_dir=FINAL_PATH
+                        ))
+                        continue
 
-                progress.advance(task)
+                    in_flight.append((staging_file, executor.submit(
+                        self.image_processor.compress_jpeg_safe,
+                        staging_file, output_path=final_path, temp_dir=FINAL_PATH
+                    )))
+                    if len(in_flight) >= 2 * workers:
+                        done_file, future = in_flight.popleft()
+                        finish(done_file, *future.result())
+
+                while in_flight:
+                    done_file, future = in_flight.popleft()
+                    finish(done_file, *future.result())
+            finally:
+                # On Ctrl+C, running compressions complete (their output is already valid)
+                # but their staging originals are kept; a re-run simply recompresses them
+                if executor is not None:
+                    executor.shutdown(wait=True, cancel_futures=True)
+
+        # Check each location once for the RAW cleanup steps below (Final exists unless dry run)
+        final_exists = FINAL_PATH.exists()
+        camera_exists = CAMERA_PATH.exists()
+        raws_exists = RAWS_PATH.exists()
+
+        # Original bases of all finalized JPGs (handles both old and timestamp-renamed files).
+        # Computed once and handed to both steps below: Step 1 has just written into Final,
+        # so get_final_bases' mtime-guarded memo cannot serve the second lookup.
+        final_jpg_bases = self.file_manager.get_final_bases(FINAL_PATH) if final_exists else frozenset()
 
         # Step 2: Delete RAW files from camera for finalized images
         # Note: RAW files are now deleted during import, so this will typically find nothing.
         # Kept for backwards compatibility in case RAWs are manually added to camera.
-        if CAMERA_PATH.exists() and FINAL_PATH.exists():
-            final_jpgs = scan_for_images(FINAL_PATH, '.JPG')
-            # Use extract_original_base to handle both old and timestamp-renamed files
-            final_jpg_bases = {extract_original_base(jpg_file.name) for jpg_file in final_jpgs}
-
+        if camera_exists and final_exists:
             camera_files = self.file_manager.scan_camera_files()
             camera_raws = camera_files.get('.RAF', [])
             finalized_raws = [raw for raw in camera_raws if extract_original_base(raw.name) in final_jpg_bases]
 
             if finalized_raws:
                 info(f"Deleting {len(finalized_raws)} RAW files from camera")
-                for raw_file in finalized_raws:
-                    if not dry_run:
-                        try:
-                            raw_file.unlink()
+                if not dry_run:
+                    self.file_manager.invalidate_camera_scan()
+                    for raw_file, (deleted, delete_error) in zip(finalized_raws, batch_unlink(finalized_raws)):
+                        if deleted:
                             stats['deleted_camera_raws'] += 1
-                        except Exception as e:
-                            error(f"Failed to delete camera RAW {raw_file.name}: {e}")
+                        else:
+                            error(f"Failed to delete camera RAW {raw_file.name}: {delete_error}")
                             stats['errors'] += 1
-                    else:
-                        stats['deleted_camera_raws'] += 1
+                else:
+                    stats['deleted_camera_raws'] = len(finalized_raws)
 
-        # Step 4: Clean up orphaned local RAW files
-        if RAWS_PATH.exists() and FINAL_PATH.exists():
-            final_jpgs = scan_for_images(FINAL_PATH, '.JPG')
-            # Use extract_original_base to handle both old and timestamp-renamed files
-            final_jpg_bases = {extract_original_base(jpg_file.name) for jpg_file in final_jpgs}
-            raw_files = [raf for raf in RAWS_PATH.glob('*.RAF') if is_valid_image_file(raf)]
-            orphaned_raws = [raw_file for raw_file in raw_files if extract_original_base(raw_file.name) not in final_jpg_bases]
+        # Step 4: Clean up orphaned local RAW files (same pass as `photoflow cleanup`,
+        # reusing the Final bases from above). Only reports when there is something to clean up.
+        if raws_exists and final_exists:
+            def on_found(orphaned_count: int) -> None:
+                if orphaned_count:
+                    info(f"Found {orphaned_count} orphaned local RAW files")
 
-            stats['orphaned_raws'] = len(orphaned_raws)
+            def on_deleted(raw_file: Path, deleted: bool, delete_error: str) -> None:
+                if not deleted:
+                    error(f"Failed to delete orphaned RAW {raw_file.name}: {delete_error}")
 
-            if orphaned_raws:
-                info(f"Found {len(orphaned_raws)} orphaned local RAW files")
-                if not dry_run:
-                    for raw_file in orphaned_raws:
-                        try:
-                            raw_file.unlink()
-                            stats['deleted_raws'] += 1
-                        except Exception as e:
-                            error(f"Failed to delete orphaned RAW {raw_file.name}: {e}")
-                            stats['errors'] += 1
-                else:
-                    stats['deleted_raws'] = len(orphaned_raws)
+            cleanup_stats = self._remove_orphaned_raws(final_jpg_bases, dry_run, on_found, on_deleted)
+            stats['orphaned_raws'] = cleanup_stats['orphaned']
+            # Dry runs report what would be deleted
+            stats['deleted_raws'] = cleanup_stats['orphaned'] if dry_run else cleanup_stats['deleted']
+            stats['errors'] += cleanup_stats['errors']
 
         return stats
 
@@ -466,42 +853,66 @@ class PhotoWorkflow:
 
         info("Scanning for orphaned RAW files...")
 
-        # Get all JPGs in the final folder
-        final_jpgs = scan_for_images(FINAL_PATH, '.JPG')
-
         # Extract original base filenames from final JPGs (handles both old and timestamp-renamed files)
-        final_jpg_bases = {extract_original_base(jpg_file.name) for jpg_file in final_jpgs}
+        final_jpg_bases = self.file_manager.get_final_bases(FINAL_PATH)
 
-        # Get all RAFs in the RAWs folder
-        raw_files = [raf for raf in RAWS_PATH.glob('*.RAF') if is_valid_image_file(raf)]
+        # The progress bar is only shown once there is something to delete
+        progress = create_progress()
+        task = None
 
-        # Find orphaned RAWs (those without a corresponding JPG in final)
-        # Compare using original base to handle timestamp-renamed files
-        orphaned_raws = [raw_file for raw_file in raw_files
-                         if extract_original_base(raw_file.name) not in final_jpg_bases]
+        def on_found(orphaned_count: int) -> None:
+            nonlocal task
+            info(f"Found {orphaned_count} orphaned RAW files")
+            if not dry_run and orphaned_count:
+                progress.start()
+                task = progress.add_task(
+                    f"[cyan]Deleting {orphaned_count} orphaned RAW files",
+                    total=orphaned_count
+                )
 
-        # Count orphaned RAWs
-        stats['orphaned'] = len(orphaned_raws)
+        def on_deleted(raw_file: Path, deleted: bool, delete_error: str) -> None:
+            if not deleted:
+                error(f"Failed to delete {raw_file.name}: {delete_error}")
+            progress.advance(task)
 
-        info(f"Found {len(orphaned_raws)} orphaned RAW files")
+        try:
+            return self._remove_orphaned_raws(final_jpg_bases, dry_run, on_found, on_deleted)
+        finally:
+            if task is not None:
+                progress.stop()
+
+    def _remove_orphaned_raws(self, final_bases: FrozenSet[str], dry_run: bool,
+                              on_found: Optional[Callable[[int], None]] = None,
+                              on_deleted: Optional[Callable[[Path, bool, str], None]] = None) -> Dict[str, int]:
+        """
+        Delete the RAWs in RAWS_PATH whose original base has no JPG in Final.
 
-        # If not dry run, delete the orphaned RAWs
-        if not dry_run and orphaned_raws:
-            with create_progress() as progress:
-                task = progress.add_task(
-                    f"[cyan]Deleting {len(orphaned_raws)} orphaned RAW files",
-                    total=len(orphaned_raws)
-                )
+        Prints nothing; finalize_staging and `photoflow cleanup` report through the callbacks.
 
-                for raw_file in orphaned_raws:
-                    try:
-                        raw_file.unlink()
-                        stats['deleted'] += 1
-                    except Exception as e:
-                        error(f"Failed to delete {raw_file.name}: {e}")
-                        stats['errors'] += 1
+        Args:
+            final_bases: Original bases of the JPGs in Final (see FileManager.get_final_bases)
+            dry_run: If True, only count the orphaned RAWs
+            on_found: Called with the number of orphaned RAWs before any is deleted
+            on_deleted: Called as on_deleted(raw_file, deleted, error) after each deletion
 
-                    progress.advance(task)
+        Returns:
+            Dict with 'orphaned', 'deleted', 'errors' counts
+        """
+        stats = {'orphaned': 0, 'deleted': 0, 'errors': 0}
+
+        # Compare using original base to handle timestamp-renamed files
+        orphaned_raws = [raw_file for raw_file in _list_raws(RAWS_PATH)
+                         if extract_original_base(raw_file.name) not in final_bases]
+        stats['orphaned'] = len(orphaned_raws)
+        if on_found:
+            on_found(len(orphaned_raws))
+
+        if not dry_run and orphaned_raws:
+            for deleted, _ in batch_unlink(orphaned_raws, on_done=on_deleted):
+                if deleted:
+                    stats['deleted'] += 1
+                else:
+                    stats['errors'] += 1
 
         return stats
 
@@ -522,7 +933,7 @@ class PhotoWorkflow:
 
         # Count files in staging
         if STAGING_PATH.exists():
-            report.staging_files = len(scan_for_images(STAGING_PATH, '.JPG'))
+            report.staging_files = sum(1 for _ in scan_for_images_iter(STAGING_PATH, '.JPG'))
 
         # Count pending files on camera (if connected)
         # All files on camera are pending - no copy-back means camera only has new photos
@@ -576,6 +987,8 @@ class PhotoWorkflow:
         gallery_images_path = GALLERY_PATH / "images"
         if not dry_run:
             gallery_images_path.mkdir(parents=True, exist_ok=True)
+            # Copy temp files left by a crashed or killed sync must not reach the build
+            _remove_stale_temp_files(gallery_images_path)
 
         # Get JPG files with case-insensitive extension matching
         final_jpgs = scan_for_images(FINAL_PATH, '.JPG')
@@ -583,7 +996,7 @@ class PhotoWorkflow:
 
         # Extract metadata and filter high-rated images
         high_rated_images = []
-        all_metadata = []
+        high_rated_metadata = []
 
         # Use Rich Progress for metadata extraction
         from photo_flow.console_utils import create_progress
@@ -594,44 +1007,62 @@ class PhotoWorkflow:
                 total=len(final_jpgs)
             )
 
-            for jpg_path in final_jpgs:
-                # Extract metadata
-                metadata = MetadataExtractor.extract_metadata(jpg_path)
-
-                # Add metadata to the list
-                all_metadata.append(metadata)
+            # EXIF/XMP parsing is CPU-bound and independent per image: spread it over all
+            # cores. Small batches stay in-process, where spawning workers would cost more.
+            if len(final_jpgs) >= _PARALLEL_METADATA_MIN_FILES:
+                executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+                metadata_results = executor.map(MetadataExtractor.extract_metadata, final_jpgs, chunksize=16)
+            else:
+                executor = None
+                metadata_results = map(MetadataExtractor.extract_metadata, final_jpgs)
 
-                # Check if image has rating 4+
-                rating = metadata.get('rating', 0)
+            try:
+                # Results arrive in input order, so progress advances as each one is ready
+                for jpg_path, metadata in zip(final_jpgs, metadata_results):
+                    # Check if image has rating 4+ (only those go to the gallery and its JSON)
+                    rating = metadata.get('rating', 0)
 
-                if rating >= 4:
-                    high_rated_images.append((jpg_path, metadata))
+                    if rating >= 4:
+                        high_rated_images.append((jpg_path, metadata))
+                        high_rated_metadata.append(metadata)
 
-                progress.advance(task)
+                    progress.advance(task)
+            finally:
+                if executor is not None:
+                    executor.shutdown(wait=True, cancel_futures=True)
 
         info(f"Found {len(high_rated_images)} images with rating 4+")
 
         # Get existing gallery images
         existing_gallery_images = scan_for_images(gallery_images_path, '.JPG') if gallery_images_path.exists() else []
-        existing_gallery_image_names = {img.name for img in existing_gallery_images}
+        # Name -> gallery path, so the update check below reuses the scanned paths
+        gallery_by_name = {img.name: img for img in existing_gallery_images}
 
-        logger.debug(f"Existing gallery images: {len(existing_gallery_images)}")
-        logger.debug(f"Existing gallery image names: {existing_gallery_image_names}")
+        logger.debug("Existing gallery images: %d", len(existing_gallery_images))
+        logger.debug("Existing gallery image names: %s", gallery_by_name.keys())
 
         # Determine which images to copy to gallery
-        high_rated_image_names = {img[0].name for img in high_rated_images}
+        high_rated_image_names = frozenset(img[0].name for img in high_rated_images)
 
-        logger.debug(f"High-rated images: {len(high_rated_images)}")
-        logger.debug(f"High-rated image names: {high_rated_image_names}")
+        logger.debug("High-rated images: %d", len(high_rated_images))
+        logger.debug("High-rated image names: %s", high_rated_image_names)
 
         # Images to remove (in gallery but no longer high-rated)
         images_to_remove = [img for img in existing_gallery_images if img.name not in high_rated_image_names]
 
-        # Images to copy (high-rated but not in gallery)
-        images_to_copy = [img[0] for img in high_rated_images if img[0].name not in existing_gallery_image_names]
+        # Images to copy (high-rated but not in gallery) and to check for changes (already in
+        # gallery, paired with their gallery copy), split in one pass
+        images_to_copy = []
+        images_to_update = []
+        for src_path, _ in high_rated_images:
+            dst_path = gallery_by_name.get(src_path.name)
+            if dst_path is None:
+                images_to_copy.append(src_path)
+            else:
+                images_to_update.append((src_path, dst_path))
 
-        logger.debug(f"Images to remove: {len(images_to_remove)}")
-        logger.debug(f"Images to copy: {len(images_to_copy)}")
+        logger.debug("Images to remove: %d", len(images_to_remove))
+        logger.debug("Images to copy: %d", len(images_to_copy))
 
         # Remove images that no longer qualify
         if not dry_run and images_to_remove:
@@ -647,76 +1078,79 @@ class PhotoWorkflow:
                     print_error(error_msg)
                     stats['errors'] += 1
 
-        # Copy/update high-rated images to gallery
-        total_to_process = len(images_to_copy)
-
-        if total_to_process > 0:
-            with create_progress() as progress:
-                task = progress.add_task(
-                    f"[cyan]Copying {total_to_process} new images to gallery",
-                    total=total_to_process
-                )
+        # One hash cache transaction for all copy verifications below, instead of a commit
+        # per file
+        with FileManager.hash_cache_batch():
+            # Copy/update high-rated images to gallery
+            total_to_process = len(images_to_copy)
+            copied_count = 0
+
+            if total_to_process > 0:
+                with create_progress() as progress:
+                    task = progress.add_task(
+                        f"[cyan]Copying {total_to_process} new images to gallery",
+                        total=total_to_process
+                    )
 
-                for img_path in images_to_copy:
-                    if not dry_run:
-                        dst_path = gallery_images_path / img_path.name
-                        success, error_msg = FileManager.safe_copy(img_path, dst_path)
-                        if success:
-                            stats['synced'] += 1
+                    for img_path in images_to_copy:
+                        if not dry_run:
+                            dst_path = gallery_images_path / img_path.name
+                            success, error_msg = FileManager.safe_copy(img_path, dst_path)
+                            if success:
+                                stats['synced'] += 1
+                                copied_count += 1
+                            else:
+                                logger.error("Error copying %s: %s", img_path.name, error_msg)
+                                stats['errors'] += 1
                         else:
-                            logger.error(f"Error copying {img_path.name}: {error_msg}")
-                            stats['errors'] += 1
-                    else:
-                        stats['synced'] += 1
-
-                    progress.advance(task)
-
-        # Check existing high-rated images for changes
-        images_to_update = [(img[0], img[1]) for img in high_rated_images if
-                            img[0].name in existing_gallery_image_names]
-
-        unchanged_count = 0
+                            stats['synced'] += 1
 
-        # Check and update existing images silently (no verbose output)
-        for src_path, metadata in images_to_update:
-            dst_path = gallery_images_path / src_path.name
+                        progress.advance(task)
 
-            # Skip if files are identical
-            is_dup, err = FileManager.is_duplicate(src_path, dst_path)
-            if err:
-                logger.error(f"Error checking {src_path.name}: {err}")
-                stats['errors'] += 1
-            elif is_dup:
-                unchanged_count += 1
-                continue
+            # Check existing high-rated images for changes
+            unchanged_count = 0
 
-            # Copy the file if it has changed
-            if not dry_run:
+            # Check and update existing images silently (no verbose output). Each check stats
+            # and possibly reads two files, so several run at once to keep the disk busy.
+            if images_to_update:
+                executor = ThreadPoolExecutor(max_workers=min(BATCH_IO_WORKERS, len(images_to_update)))
                 try:
-                    success, error = FileManager.safe_copy(src_path, dst_path)
-                    if success:
-                        stats['synced'] += 1
-                    else:
-                        logger.error(f"Error updating {src_path.name}: {error}")
-                        stats['errors'] += 1
-                except Exception as e:
-                    logger.error(f"Error updating {src_path.name}: {e}")
-                    stats['errors'] += 1
-            else:
-                stats['synced'] += 1
+                    futures = [
+                        executor.submit(self._check_and_copy, src_path, dst_path, dry_run)
+                        for src_path, dst_path in images_to_update
+                    ]
+                    for future in as_completed(futures):
+                        status, check_error, message = future.result()
+                        if check_error:
+                            logger.error("%s", check_error)
+                            stats['errors'] += 1
+                        if status == 'unchanged':
+                            unchanged_count += 1
+                        elif status == 'synced':
+                            stats['synced'] += 1
+                        else:
+                            logger.error("%s", message)
+                            stats['errors'] += 1
+                finally:
+                    # On Ctrl+C, let in-flight copies finish their verification but drop the rest
+                    executor.shutdown(wait=True, cancel_futures=True)
 
         stats['unchanged'] = unchanged_count
 
-        # Calculate total images in gallery after sync
+        # Calculate total images in gallery after sync from what was removed and added, instead
+        # of scanning the gallery folder again
         if not dry_run:
-            stats['total_in_gallery'] = len(scan_for_images(gallery_images_path, '.JPG'))
+            stats['total_in_gallery'] = len(existing_gallery_images) - stats['removed'] + copied_count
+            if logger.isEnabledFor(logging.DEBUG):
+                actual_total = sum(1 for _ in scan_for_images_iter(gallery_images_path, '.JPG'))
+                if actual_total != stats['total_in_gallery']:
+                    logger.debug("Gallery count drift: computed %d, found %d",
+                                 stats['total_in_gallery'], actual_total)
         else:
             # In dry run mode, estimate the total
             stats['total_in_gallery'] = len(existing_gallery_images) - len(images_to_remove) + len(images_to_copy)
 
         # Generate metadata JSON for all high-rated images
-        high_rated_metadata = [metadata for metadata in all_metadata if metadata.get('rating', 0) >= 4]
-
         if not dry_run:
             json_path = GALLERY_PATH / "metadata.json"
             stats['json_updated'] = MetadataExtractor.generate_metadata_json(high_rated_metadata, json_path)
@@ -726,63 +1160,94 @@ class PhotoWorkflow:
             photo_gallery_path = GALLERY_PATH.parent
 
             # Use status spinner for build
-            from photo_flow.console_utils import show_status
+            from photo_flow.console_utils import show_status, error as print_error
 
-            try:
-                with show_status("Building gallery with npm", spinner="dots"):
-                    # Read the required Node version from .nvmrc
-                    nvmrc_path = photo_gallery_path / ".nvmrc"
-                    if nvmrc_path.exists():
-                        with open(nvmrc_path, 'r') as f:
-                            node_version = f.read().strip()
-
-                        node_version_clean = node_version.lstrip('v')
-                        node_version_path = os.path.expanduser(f"~/.nvm/versions/node/v{node_version_clean}/bin")
-
-                        env = os.environ.copy()
-                        env["PATH"] = f"{node_version_path}:{env['PATH']}"
-                    else:
-                        env = None
+            # Open the SSH control connection to the web server in the background while npm
+            # builds (kept alive through the build), so the rsync below starts without paying
+            # for the handshake
+            ssh_warmup = self._start_ssh_master(GALLERY_SSH_TARGET, GALLERY_SSH_CONTROL_PERSIST)
+
+            with show_status("Building gallery with npm", spinner="dots") as status:
+                npm_bin, env = _resolve_npm_env(photo_gallery_path)
 
-                    # Run npm build
-                    build_process = subprocess.run(
-                        ["npm", "run", "build"],
+                # Run npm build (exit code checked below, no exception round-trip), showing
+                # its progress next to the spinner
+                if npm_bin:
+                    build_process = _run_streamed(
+                        [npm_bin, "run", "build"],
                         cwd=photo_gallery_path,
-                        capture_output=True,
-                        text=True,
-                        check=True,
-                        env=env
+                        env=env,
+                        on_line=_status_updater(status, "Building gallery with npm")
                     )
-
-                # Use status spinner for rsync
-                with show_status("Syncing to remote server", spinner="dots"):
-                    rsync_process = subprocess.run(
-                        [
-                            "rsync",
-                            "-avz",
-                            "--delete",
-                            f"{photo_gallery_path}/dist/",
-                            "jkrumm@100.82.157.104:/home/jkrumm/sideproject-docker-stack/photo_gallery"
-                        ],
-                        capture_output=True,
-                        text=True,
-                        check=True
+                else:
+                    build_process = subprocess.CompletedProcess(
+                        ["npm", "run", "build"], 127,
+                        stdout="npm not found (install Node.js, or the version in .nvmrc via nvm)", stderr=None
                     )
 
-                stats['build_successful'] = True
-                stats['sync_successful'] = True
+            if build_process.returncode != 0:
+                self._wait_for_ssh_master(ssh_warmup, GALLERY_SSH_TARGET)
+
+            stats['build_successful'] = build_process.returncode == 0
+            stats['sync_successful'] = False
+            failed_process = build_process
+
+            if stats['build_successful']:
+                # Compress the WAN transfer to the VPS, but not already-compressed assets.
+                # rsync >= 3.2 negotiates zstd with a modern peer; level 1 keeps it cheap.
+                # (stock macOS rsync 2.6.9 has neither option, so both are gated on version)
+                rsync_version = self._get_rsync_version()
+                transfer_args = ["-z"]
+                if rsync_version >= (3, 0, 0):
+                    transfer_args.append(f"--skip-compress={GALLERY_RSYNC_SKIP_COMPRESS}")
+                if rsync_version >= (3, 2, 0):
+                    transfer_args.append("--compress-level=1")
+                # Build output is either unchanged (skipped by the quick check) or new
+                # content-hashed assets, so rsync's delta algorithm has nothing to match
+                if RSYNC_WHOLE_FILE:
+                    transfer_args.append("--whole-file")
+                # Restartable without exposing half-sent files on the live site: interrupted
+                # files stay in the partial dir, and --delay-updates moves all updated files
+                # into place at the end. (--inplace would let visitors load truncated assets.)
+                transfer_args.extend([f"--partial-dir={RSYNC_PARTIAL_DIR}", "--delay-updates",
+                                      f"--timeout={RSYNC_IO_TIMEOUT}"])
+
+                self._wait_for_ssh_master(ssh_warmup, GALLERY_SSH_TARGET)
+
+                # An identical rebuild (e.g. no new ratings) has nothing to send: skip rsync
+                # and its remote scan entirely
+                dist_path = photo_gallery_path / "dist"
+                fingerprint = _dist_fingerprint(dist_path)
+                try:
+                    last_fingerprint = GALLERY_DIST_HASH_PATH.read_text().strip()
+                except OSError:
+                    last_fingerprint = ""
 
-            except subprocess.CalledProcessError as e:
-                from photo_flow.console_utils import error as print_error
-                print_error(f"Build/sync failed: {e.stderr if e.stderr else str(e)}")
+                if fingerprint and fingerprint == last_fingerprint:
+                    info("[dim]Gallery build unchanged since last sync, skipping upload[/dim]")
+                    stats['sync_successful'] = True
+                else:
+                    # Use status spinner for rsync
+                    with show_status("Syncing to remote server", spinner="dots") as status:
+                        rsync_process = self._push_gallery_dist(
+                            dist_path, transfer_args, _status_updater(status, "Syncing to remote server")
+                        )
+
+                    stats['sync_successful'] = rsync_process.returncode == 0
+                    failed_process = rsync_process
+
+                    if stats['sync_successful'] and fingerprint:
+                        self._write_dist_fingerprint(fingerprint)
+
+            if not stats['sync_successful']:
+                print_error(
+                    f"Build/sync failed: {failed_process.stdout or f'exit code {failed_process.returncode}'}"
+                )
 
-                logger.error(f"Error during build or sync: {e}")
-                logger.error(f"Command output: {e.stdout}")
-                logger.error(f"Command error: {e.stderr}")
+                logger.error("Error during build or sync: %s exited with %d", failed_process.args, failed_process.returncode)
+                logger.error("Command output: %s", failed_process.stdout)
 
                 stats['errors'] += 1
-                stats['build_successful'] = False
-                stats['sync_successful'] = False
         else:
             # Dry run - don't actually build/sync
             info("[dim]Dry run: Skipping npm build and remote sync[/dim]")
@@ -790,6 +1255,105 @@ class PhotoWorkflow:
 
         return stats
 
+    @staticmethod
+    def _push_gallery_dist(dist_path: Path, transfer_args: List[str],
+                           on_line: Optional[Callable[[str], None]] = None) -> subprocess.CompletedProcess:
+        """
+        Rsync the built gallery to the web server, top-level folders in parallel.
+
+        Each folder of dist/ (hashed assets, images) first gets its own rsync, so several
+        streams share the link. A final pass over the whole tree then sends the root files
+        (index.html etc.) and runs --delete; everything else is already up to date, so it
+        only compares file lists. Pages are therefore replaced only after the assets they
+        reference have arrived.
+
+        Args:
+            dist_path (Path): Local build output directory
+            transfer_args (List[str]): Extra rsync options (compression, partial handling)
+            on_line (Callable, optional): Called with each line of rsync output (see _run_streamed)
+
+        Returns:
+            subprocess.CompletedProcess: The first failed rsync, or the final pass
+        """
+        def rsync(src: str, dst: str, *extra: str) -> subprocess.CompletedProcess:
+            return _run_streamed(
+                [_RSYNC_BIN or "rsync", "-av", *transfer_args, *extra, "-e", RSYNC_SSH_CMD,
+                 src, f"{GALLERY_SSH_TARGET}:{dst}"],
+                on_line=on_line
+            )
+
+        try:
+            subdirs = [entry.name for entry in os.scandir(dist_path)
+                       if entry.is_dir(follow_symlinks=False)]
+        except OSError:
+            subdirs = []
+
+        if len(subdirs) > 1 and GALLERY_RSYNC_WORKERS > 1:
+            executor = ThreadPoolExecutor(max_workers=min(GALLERY_RSYNC_WORKERS, len(subdirs)))
+            try:
+                # No --delete here: stale files are removed by the final pass
+                results = list(executor.map(
+                    lambda name: rsync(f"{dist_path / name}/", f"{GALLERY_REMOTE_PATH}/{name}/"),
+                    subdirs
+                ))
+            finally:
+                executor.shutdown(wait=True, cancel_futures=True)
+            for result in results:
+                if result.returncode != 0:
+                    return result
+
+        return rsync(f"{dist_path}/", GALLERY_REMOTE_PATH, "--delete")
+
+    @staticmethod
+    def _write_dist_fingerprint(fingerprint: str) -> None:
+        """Record the fingerprint of a pushed build (atomically; a failure only costs a re-sync)."""
+        try:
+            GALLERY_DIST_HASH_PATH.parent.mkdir(parents=True, exist_ok=True)
+            temp_path = GALLERY_DIST_HASH_PATH.with_name(GALLERY_DIST_HASH_PATH.name + ".tmp")
+            temp_path.write_text(fingerprint + "\n")
+            os.replace(temp_path, GALLERY_DIST_HASH_PATH)
+        except OSError as e:
+            logger.warning("Could not record gallery build fingerprint: %s", e)
+
+    @staticmethod
+    def _check_and_copy(src_path: Path, dst_path: Path, dry_run: bool) -> Tuple[str, str, str]:
+        """
+        Update one existing gallery image from Final if it has changed.
+
+        Args:
+            src_path (Path): Image in Final
+            dst_path (Path): Its copy in the gallery
+            dry_run (bool): If True, report a changed image as synced without copying it
+
+        Returns:
+            Tuple[str, str, str]: (status, check_error, error_message) - status is 'synced',
+                                  'unchanged' or 'error'; check_error is set if the comparison
+                                  failed (the copy is attempted anyway); error_message is empty
+                                  unless status is 'error'
+        """
+        # Skip if files are identical. Quick check (like rsync): same size and mtime means
+        # unchanged without reading; gallery copies are made with copy2, so mtime is
+        # preserved from Final, and a stale gallery copy is harmless. Otherwise compare
+        # bytes, which stops at the first difference instead of hashing both files, unless
+        # both files are in the hash cache from the verification of an earlier update.
+        is_dup, err = FileManager.files_equal(src_path, dst_path, trust_mtime=True, use_cache=True)
+        # Still try the copy on a check error: safe_copy's own verification decides whether it worked
+        check_error = f"Error checking {src_path.name}: {err}" if err else ""
+        if not err and is_dup:
+            return 'unchanged', "", ""
+
+        if dry_run:
+            return 'synced', check_error, ""
+
+        # Copy the file if it has changed
+        try:
+            success, copy_error = FileManager.safe_copy(src_path, dst_path)
+        except Exception as e:
+            success, copy_error = False, str(e)
+        if success:
+            return 'synced', check_error, ""
+        return 'error', check_error, f"Error updating {src_path.name}: {copy_error}"
+
     def backup_final_to_homelab(self, dry_run: bool = False, progress_callback=None) -> Dict[str, any]:
         """
         Backup the Final folder to the homelab server via rsync.
@@ -845,6 +1409,7 @@ class PhotoWorkflow:
             remote = f"{HOMELAB_USER}@{HOMELAB_HOST}"
             count_cmd = f"find {remote_path} -maxdepth 1 -name '{extension}' 2>/dev/null | wc -l"
 
+            _ensure_ssh_control_dir()
             result = subprocess.run(
                 ["ssh"] + RSYNC_SSH_CMD.split()[1:] + [remote, count_cmd],
                 capture_output=True,
@@ -902,7 +1467,13 @@ class PhotoWorkflow:
 
         if check_remote:
             connection_method = None
+            # One quick probe instead of three ssh commands each waiting for their timeout
+            reachable = _homelab_reachable()
             for key, info in result.items():
+                if not reachable:
+                    info['remote_count'] = -1
+                    info['needs_sync'] = -1
+                    continue
                 remote_count, method = self._get_remote_file_count(
                     info['remote_path'],
                     info['extension']
@@ -916,19 +1487,31 @@ class PhotoWorkflow:
 
         return result
 
-    def _get_rsync_version(self) -> tuple[int, int, int]:
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_rsync_version() -> tuple[int, int, int]:
         """Get rsync version as tuple (major, minor, patch). Returns (0, 0, 0) on error."""
-        import re
         try:
-            result = subprocess.run(["rsync", "--version"], capture_output=True, text=True)
-            # Parse "rsync  version 3.2.7" or "rsync version 2.6.9"
-            match = re.search(r'version (\d+)\.(\d+)\.?(\d*)', result.stdout)
-            if match:
-                major, minor, patch = match.groups()
-                return (int(major), int(minor), int(patch) if patch else 0)
+            result = subprocess.run([_RSYNC_BIN, "--version"], capture_output=True, text=True)
+            return _parse_rsync_version(result.stdout)
         except Exception:
-            pass
-        return (0, 0, 0)
+            return (0, 0, 0)
+
+    @staticmethod
+    @functools.lru_cache(maxsize=1)
+    def _get_remote_rsync_version() -> tuple[int, int, int]:
+        """Get the homelab's rsync version via SSH. Returns (0, 0, 0) on error."""
+        try:
+            _ensure_ssh_control_dir()
+            result = subprocess.run(
+                ["ssh"] + RSYNC_SSH_CMD.split()[1:] + [f"{HOMELAB_USER}@{HOMELAB_HOST}", "rsync --version"],
+                capture_output=True,
+                text=True,
+                timeout=10
+            )
+            return _parse_rsync_version(result.stdout)
+        except Exception:
+            return (0, 0, 0)
 
     def _run_backup_rsync(
         self,
@@ -960,10 +1543,8 @@ class PhotoWorkflow:
         Returns:
             Dict with 'scanned', 'sync_successful', 'connection_method', 'trash_path', 'errors'
         """
-        import re
         from datetime import datetime
         from photo_flow.console_utils import info, error as print_error, warning
-        from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
 
         stats = {
             'source': source_name,
@@ -979,30 +1560,42 @@ class PhotoWorkflow:
             print_error(f"Source folder does not exist: {source_path}")
             return stats
 
-        if shutil.which("rsync") is None:
+        if _RSYNC_BIN is None:
             print_error("rsync not found on PATH. Please install rsync.")
             stats['errors'] += 1
             return stats
 
+        # Fail fast when offline instead of letting every rsync shard wait for ssh to time out
+        if not _homelab_reachable():
+            print_error(f"Homelab {HOMELAB_HOST} not reachable on port {HOMELAB_SSH_PORT}. Is Tailscale connected?")
+            stats['errors'] += 1
+            return stats
+
+        # Open the shared SSH master in the background while the local checks below run, so
+        # the handshake overlaps them instead of delaying the first remote command. Also keeps
+        # parallel shards from racing to become master (losers pay for full handshakes).
+        # Dry runs use a single rsync, so they skip the warmup.
+        homelab_target = f"{HOMELAB_USER}@{HOMELAB_HOST}"
+        ssh_warmup = None if dry_run else self._start_ssh_master(homelab_target)
+
         # Check rsync version for progress2 support (requires >= 3.1.0)
         rsync_version = self._get_rsync_version()
         use_progress2 = rsync_version >= (3, 1, 0)
 
-        # Count files
+        # Safety check first: stops after min_files matches, so an empty or unmounted
+        # folder is rejected without walking and stat'ing the whole tree
         try:
-            files = list(source_path.glob(file_pattern))
-            stats['scanned'] = len(files)
-
-            # Safety check
-            if min_files > 0 and len(files) < min_files:
-                warning(f"{source_name.title()} folder only has {len(files)} files. Expected {min_files}+.")
+            if not count_at_least(source_path, file_pattern, min_files):
+                warning(f"{source_name.title()} folder has fewer than {min_files} {file_pattern} files.")
                 warning("This could indicate folder is empty or unmounted.")
                 warning("Backup aborted to prevent accidental deletion of remote files.")
                 stats['errors'] += 1
+                self._wait_for_ssh_master(ssh_warmup, homelab_target)
                 return stats
         except Exception as e:
             print_error(f"Failed to scan {source_name} folder: {e}")
             stats['errors'] += 1
+            self._wait_for_ssh_master(ssh_warmup, homelab_target)
             return stats
 
         # Generate timestamped trash folder name
@@ -1010,15 +1603,47 @@ class PhotoWorkflow:
         trash_folder = f"{HOMELAB_TRASH_PATH}/{source_name}_{timestamp}"
         stats['trash_path'] = trash_folder
 
-        remote = f"{HOMELAB_USER}@{HOMELAB_HOST}:{str(remote_dest)}"
-        src = f"{str(source_path)}/"  # trailing slash = sync contents
+        src, remote = _rsync_endpoints(source_path, remote_dest)
+
+        # Dry runs have no side effects to parallelize: one rsync, one remote scan
+        shard_count = 1 if dry_run else max(1, min(RSYNC_MAX_SHARDS, os.cpu_count() or 1))
+
+        self._wait_for_ssh_master(ssh_warmup, homelab_target)
+
+        # First (backfill) sync: write files in place instead of temp-file-then-rename,
+        # halving remote writes. Later incremental runs keep atomic rename semantics.
+        # Only an empty or missing remote folder counts as a first sync: backups made before
+        # the sentinel existed are populated but unmarked, so they get marked and synced normally.
+        initial_sync = False
+        if not dry_run and not self._remote_sentinel_exists(remote_dest):
+            if self._remote_dir_empty(remote_dest):
+                initial_sync = True
+            else:
+                self._mark_initial_sync_done(remote_dest)
 
         # Connect via Tailscale (encrypted mesh network)
-        cmd = ["rsync", "-a", "--partial", "--whole-file"]
+        # --timeout aborts stalled transfers instead of hanging forever
+        cmd = [_RSYNC_BIN, *_RSYNC_BASE_FLAGS]
+        if initial_sync:
+            # --inplace cannot be combined with --partial-dir
+            cmd.extend(["--inplace", "--whole-file"])
+        else:
+            # Partial files are kept in a hidden dir on the remote so an interrupted run
+            # resumes mid-file next time
+            cmd.append(f"--partial-dir={RSYNC_PARTIAL_DIR}")
+            if RSYNC_WHOLE_FILE:
+                # Skip the delta algorithm: rolling checksums never match on JPEG/RAF/MOV data
+                cmd.append("--whole-file")
+
+        if not dry_run and RSYNC_PREALLOCATE and min(rsync_version, self._get_remote_rsync_version()) >= (3, 1, 0):
+            # Receiver reserves each file's full size up front (fallocate on ext4/XFS):
+            # contiguous extents and fewer metadata updates for large RAF/MOV files
+            cmd.append("--preallocate")
 
         if use_progress2:
             # Modern rsync: overall progress with --info=progress2
-            cmd.extend(["--info=progress2", "--no-inc-recursive"])
+            # --outbuf=L forces line-buffered stdout so progress arrives while piped, not in bursts
+            cmd.extend(["--info=progress2", "--no-inc-recursive", "--outbuf=L"])
         else:
             # Old rsync: per-file progress, parse to-chk for overall
             cmd.append("--progress")
@@ -1026,62 +1651,389 @@ class PhotoWorkflow:
         # Use --backup --backup-dir instead of --delete
         cmd.extend(["--backup", f"--backup-dir={trash_folder}"])
         # Add exclusion patterns for system files
-        for pattern in RSYNC_EXCLUDE_PATTERNS:
-            cmd.extend(["--exclude", pattern])
+        cmd.append(f"--exclude-from={_rsync_exclude_file()}")
+        _ensure_ssh_control_dir()
         cmd.extend(["-e", RSYNC_SSH_CMD])
         if dry_run:
-            cmd.append("-n")
-        cmd.extend([src, remote])
+            # --stats reports how much would be transferred (shown after the run)
+            cmd.extend(["--dry-run", "--stats"])
+        # Shared, immutable prefix: each shard only appends its own file list and endpoints
+        base_cmd = tuple(cmd)
+
+        # Split the transfer into size-balanced shards, one rsync (and TCP stream) each.
+        # rsync gets explicit --files-from lists so it skips its own sender-side tree walk.
+        shard_lists = []
+        try:
+            list_files = []
+            try:
+                for _ in range(shard_count):
+                    list_files.append(tempfile.NamedTemporaryFile(
+                        mode='wb', prefix=f"photoflow-{source_name}-", suffix='.files', delete=False
+                    ))
+                    shard_lists.append(Path(list_files[-1].name))
+                # Scan once, streaming paths straight into the lists. Files unchanged since the
+                # last successful backup (per its manifest) are left out, so rsync neither
+                # stats nor compares them; without a manifest, everything is compared.
+                if initial_sync:
+                    manifest, full_scan_at = None, time.time()
+                else:
+                    # full_scan_at is kept across saves, so the age counts from the last full run
+                    manifest, full_scan_at = _load_backup_manifest(source_name, remote_dest)
+                new_manifest = {}
+                stats['scanned'], shard_bytes, shard_counts = self._write_backup_file_lists(
+                    source_path, list_files, file_pattern, manifest, new_manifest
+                )
+            finally:
+                for list_file in list_files:
+                    list_file.close()
+
+            if manifest is not None and not any(shard_counts):
+                info(f"[green]✓[/green] {source_name.title()} backup up to date (no changes since last backup)")
+                stats['sync_successful'] = True
+                stats['connection_method'] = 'tailscale'
+                return stats
 
-        info("Connecting via Tailscale...")
+            # Only launch rsync for shards that received files (always at least one)
+            used = [idx for idx in range(shard_count) if shard_counts[idx]] or [0]
+            commands = [
+                [*base_cmd, "--from0", f"--files-from={shard_lists[idx]}", src, remote] for idx in used
+            ]
+            shard_bytes = [max(1, shard_bytes[idx]) for idx in used]
+
+            # Bulk mode: a first backup of many files into an empty folder has nothing to
+            # compare, so a tar stream skips rsync's per-file negotiation entirely
+            total_files = sum(shard_counts)
+            if initial_sync and HOMELAB_BULK_THRESHOLD and total_files > HOMELAB_BULK_THRESHOLD:
+                info(f"Connecting via Tailscale (bulk tar of {total_files} files"
+                     f"{f', {len(used)} parallel streams' if len(used) > 1 else ''})...")
+                with show_status(f"Streaming {source_name} backup", spinner="dots"):
+                    return_codes, error_lines = self._run_tar_shards(
+                        source_path, remote_dest, [shard_lists[idx] for idx in used]
+                    )
+            else:
+                info(f"Connecting via Tailscale{f' ({len(commands)} parallel streams)' if len(commands) > 1 else ''}...")
+                return_codes, error_lines = self._run_rsync_shards(
+                    commands, shard_bytes, source_name, use_progress2
+                )
 
+            if all(rc == 0 for rc in return_codes):
+                stats['sync_successful'] = True
+                stats['connection_method'] = 'tailscale'
+                if initial_sync:
+                    self._mark_initial_sync_done(remote_dest)
+                if not dry_run:
+                    _save_backup_manifest(source_name, remote_dest, new_manifest, full_scan_at)
+                if dry_run:
+                    for line in error_lines:
+                        if line.startswith(_RSYNC_DRY_RUN_STAT_LINES):
+                            info(f"  [dim]{line}[/dim]")
+                info(f"[green]✓[/green] {source_name.title()} backup completed via Tailscale")
+                return stats
+            else:
+                stats['errors'] += 1
+                failed_codes = sorted({rc for rc in return_codes if rc != 0})
+                print_error(f"Rsync failed (exit code: {', '.join(str(rc) for rc in failed_codes)})")
+                if error_lines:
+                    for err_line in error_lines[-5:]:  # Show last 5 error lines
+                        print_error(f"  {err_line}")
+
+        except Exception as e:
+            stats['errors'] += 1
+            print_error(f"Backup failed: {e}")
+
+        finally:
+            for list_path in shard_lists:
+                list_path.unlink(missing_ok=True)
+
+        return stats
+
+    @staticmethod
+    def _run_remote_command(command: str, timeout: int = 10) -> int:
+        """
+        Run a shell command on the homelab via SSH (Tailscale).
+
+        Returns:
+            The command's exit code, 255 for SSH errors or -1 if it could not be run
+        """
         try:
-            # Run rsync with real-time progress parsing
-            proc = subprocess.Popen(
-                cmd,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1  # Line buffered
+            _ensure_ssh_control_dir()
+            result = subprocess.run(
+                ["ssh"] + RSYNC_SSH_CMD.split()[1:] + [f"{HOMELAB_USER}@{HOMELAB_HOST}", command],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+                timeout=timeout
+            )
+            return result.returncode
+        except (subprocess.TimeoutExpired, OSError):
+            return -1
+
+    @staticmethod
+    def _start_ssh_master(target: str, control_persist: Optional[str] = None):
+        """
+        Start opening the multiplexed SSH connection to target in the background.
+
+        Args:
+            target (str): user@host to connect to
+            control_persist (str, optional): Overrides ControlPersist from RSYNC_SSH_CMD, for a
+                                             master that has to stay up through a long local step
+
+        Returns:
+            The ssh process (wait with _wait_for_ssh_master), or None if ssh could not be started
+        """
+        _ensure_ssh_control_dir()
+        # The first -o wins in ssh, so this overrides the value from RSYNC_SSH_CMD
+        persist_args = ["-o", f"ControlPersist={control_persist}"] if control_persist else []
+        try:
+            return subprocess.Popen(
+                ["ssh", *persist_args, *RSYNC_SSH_CMD.split()[1:], target, "true"],
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL
             )
+        except OSError:
+            return None
+
+    @staticmethod
+    def _wait_for_ssh_master(process, target: str, timeout: int = 10) -> None:
+        """Wait for a background SSH warmup; rsync falls back to its own connection if it failed."""
+        if process is None:
+            return
+        try:
+            if process.wait(timeout=timeout) != 0:
+                logger.warning("Could not pre-establish SSH control connection to %s", target)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    def _remote_sentinel_exists(self, remote_dest: Path) -> bool:
+        """
+        Check whether an initial sync to remote_dest has completed.
+
+        Only a definite "file missing" answer (exit code 1 from test) counts as a first
+        sync; SSH errors are treated as "exists" so rsync keeps its safe rename semantics.
+        """
+        sentinel = shlex.quote(f"{remote_dest}/{_INITIAL_SYNC_SENTINEL}")
+        return self._run_remote_command(f"test -f {sentinel}") != 1
+
+    def _remote_dir_empty(self, remote_dest: Path) -> bool:
+        """Check that remote_dest is missing or empty (SSH errors count as not empty)."""
+        dest = shlex.quote(os.fspath(remote_dest))
+        return self._run_remote_command(f'test -z "$(ls -A {dest} 2>/dev/null)"') == 0
+
+    @staticmethod
+    def _run_tar_shards(source_path: Path, remote_dest: Path,
+                        list_paths: List[Path]) -> Tuple[List[int], List[str]]:
+        """
+        Stream the files of each shard list to the homelab as a tar over ssh, in parallel.
+
+        Runs ``tar -cf - --null -T list | ssh homelab 'tar -xf -'`` per shard. The pax format
+        keeps nanosecond modification times, so the next (incremental) rsync sees every file
+        as up to date instead of re-sending it.
+
+        Args:
+            source_path: Local source directory (paths in the lists are relative to it)
+            remote_dest: Remote destination directory (created if missing)
+            list_paths: NUL-separated file lists, as written by _write_backup_file_lists
+
+        Returns:
+            Tuple of (exit code per shard, collected error output lines)
+        """
+        dest = shlex.quote(os.fspath(remote_dest))
+        remote_cmd = f"mkdir -p {dest} && tar -C {dest} -xf -"
+        # Keep macOS tar from adding '._' AppleDouble entries for extended attributes
+        env = {**os.environ, "COPYFILE_DISABLE": "1"}
+        _ensure_ssh_control_dir()
+        error_lines = []
+        lock = threading.Lock()
+
+        def run_shard(list_path: Path) -> int:
+            # tar's stderr goes to a file: a full pipe nobody reads would stall the archive
+            with tempfile.TemporaryFile() as tar_errors:
+                with subprocess.Popen(
+                    ["tar", "-C", os.fspath(source_path), "--format=pax", "-cf", "-",
+                     "--null", "-T", os.fspath(list_path)],
+                    stdout=subprocess.PIPE, stderr=tar_errors, env=env
+                ) as tar_process:
+                    ssh_process = subprocess.Popen(
+                        ["ssh"] + RSYNC_SSH_CMD.split()[1:] + [f"{HOMELAB_USER}@{HOMELAB_HOST}", remote_cmd],
+                        stdin=tar_process.stdout, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+                    )
+                    # Only ssh reads the pipe now; lets tar see SIGPIPE if ssh dies
+                    tar_process.stdout.close()
+                    ssh_stderr = ssh_process.communicate()[1]
+                tar_errors.seek(0)
+                tar_stderr = tar_errors.read()
+            with lock:
+                for output in (tar_stderr, ssh_stderr):
+                    error_lines.extend(line for line in output.decode(errors="replace").splitlines() if line)
+            # A failed extract or a failed archive both fail the shard
+            return ssh_process.returncode or tar_process.returncode
+
+        executor = ThreadPoolExecutor(max_workers=len(list_paths))
+        try:
+            return_codes = list(executor.map(run_shard, list_paths))
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+        return return_codes, error_lines
+
+    def _mark_initial_sync_done(self, remote_dest: Path) -> None:
+        """Create the initial-sync sentinel so later backups use incremental mode."""
+        sentinel = shlex.quote(f"{remote_dest}/{_INITIAL_SYNC_SENTINEL}")
+        if self._run_remote_command(f"touch {sentinel}") != 0:
+            logger.warning("Could not create initial sync marker %s on homelab", sentinel)
+
+    @staticmethod
+    def _write_backup_file_lists(
+        source_path: Path,
+        list_files: List,
+        file_pattern: str,
+        manifest: Optional[Dict[str, List[int]]] = None,
+        new_manifest: Optional[Dict[str, List[int]]] = None
+    ) -> Tuple[int, List[int], List[int]]:
+        """
+        Walk source_path once and stream every file rsync should transfer into shard lists.
+
+        Each file's relative path is written NUL-terminated (for rsync --from0 --files-from)
+        to whichever shard currently holds the fewest bytes, so shards stay size-balanced
+        without keeping the whole file list in memory. RSYNC_EXCLUDE_PATTERNS are skipped.
+
+        Args:
+            source_path: Local source directory
+            list_files: One open binary file per shard
+            file_pattern: Glob pattern for the reported file count (top-level files only)
+            manifest: Files of the last successful backup (relative path -> [size, mtime_ns]);
+                      files whose size and mtime still match are not listed
+            new_manifest: Filled with [size, mtime_ns] of every file seen, listed or not
 
-            # Progress patterns
-            if use_progress2:
-                # Format: "1,234,567  45%  12.34MB/s  0:01:23"
-                progress_pattern = re.compile(
-                    r'[\d,]+\s+(\d+)%\s+([\d.]+\w+/s)\s+(\d+:\d+:\d+)'
+        Returns:
+            Tuple of (matching top-level file count, bytes per shard, files per shard)
+        """
+        shard_bytes = [0] * len(list_files)
+        shard_counts = [0] * len(list_files)
+        matched = 0
+        root = os.fspath(source_path)
+        stack = [root]
+
+        while stack:
+            directory = stack.pop()
+            is_top_level = directory == root
+            with os.scandir(directory) as it:
+                for entry in it:
+                    if _is_rsync_excluded(entry.name):
+                        continue
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                            continue
+                        if not entry.is_file():
+                            continue
+                        entry_stat = entry.stat()
+                    except OSError:
+                        continue
+
+                    if is_top_level and fnmatch.fnmatchcase(entry.name, file_pattern):
+                        matched += 1
+
+                    rel_path = os.path.relpath(entry.path, root)
+                    signature = [entry_stat.st_size, entry_stat.st_mtime_ns]
+                    if new_manifest is not None:
+                        new_manifest[rel_path] = signature
+                    if manifest is not None and manifest.get(rel_path) == signature:
+                        continue
+
+                    idx = shard_bytes.index(min(shard_bytes))
+                    list_files[idx].write(os.fsencode(rel_path) + b"\0")
+                    shard_bytes[idx] += entry_stat.st_size
+                    shard_counts[idx] += 1
+
+        return matched, shard_bytes, shard_counts
+
+    def _run_rsync_shards(
+        self,
+        commands: List[List[str]],
+        shard_bytes: List[int],
+        source_name: str,
+        use_progress2: bool
+    ) -> Tuple[List[int], List[str]]:
+        """
+        Run one or more rsync processes concurrently behind a single Rich progress bar.
+
+        Overall progress is the byte-weighted average of each shard's progress.
+
+        Args:
+            commands: One rsync argv per shard
+            shard_bytes: Total bytes per shard (used as progress weight)
+            source_name: Name shown in the progress description
+            use_progress2: Whether rsync reports --info=progress2 output
+
+        Returns:
+            Tuple of (return codes per shard, collected non-progress output lines)
+        """
+        from rich.progress import Progress, SpinnerColumn, BarColumn, TextColumn, TimeElapsedColumn
+
+        # Progress patterns
+        if use_progress2:
+            # Format: "1,234,567  45%  12.34MB/s  0:01:23"
+            progress_pattern = re.compile(
+                r'[\d,]+\s+(\d+)%\s+([\d.]+\w+/s)\s+(\d+:\d+:\d+)'
+            )
+        else:
+            # macOS rsync format: "(xfer#27, to-check=747/1960)"
+            # to-check=remaining/total - use this for overall progress
+            progress_pattern = re.compile(r'to-check=(\d+)/(\d+)')
+            # Also capture speed from per-file progress (e.g., "241.10MB/s")
+            speed_pattern = re.compile(r'(\d+\.\d+\w+/s)')
+
+        total_bytes = sum(shard_bytes)
+        shard_count = len(commands)
+        lock = threading.Lock()
+        shard_pct = [0] * shard_count
+        shard_speed = ["--"] * shard_count
+        shard_files = [(0, 0)] * shard_count
+        error_lines = []
+
+        # Rich Progress bar for rsync
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[cyan]{task.description}"),
+            BarColumn(bar_width=30),
+            TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
+            TextColumn("•"),
+            TextColumn("{task.fields[speed]:>10}"),
+            TextColumn("•"),
+            TextColumn("{task.fields[files]}"),
+            TextColumn("•"),
+            TimeElapsedColumn(),
+            transient=True,  # Remove progress bar when done
+        ) as progress:
+            task = progress.add_task(
+                f"Syncing {source_name}...",
+                total=100,
+                speed="--",
+                files="--"
+            )
+
+            def refresh(files_text: str) -> None:
+                # Caller holds the lock
+                completed = sum(p * b for p, b in zip(shard_pct, shard_bytes)) // total_bytes
+                speed = shard_speed[0] if shard_count == 1 else _format_rate(
+                    sum(_parse_rate(s) for s in shard_speed)
                 )
-            else:
-                # macOS rsync format: "(xfer#27, to-check=747/1960)"
-                # to-check=remaining/total - use this for overall progress
-                progress_pattern = re.compile(r'to-check=(\d+)/(\d+)')
-                # Also capture speed from per-file progress (e.g., "241.10MB/s")
-                speed_pattern = re.compile(r'(\d+\.\d+\w+/s)')
-
-            # Rich Progress bar for rsync
-            with Progress(
-                SpinnerColumn(),
-                TextColumn("[cyan]{task.description}"),
-                BarColumn(bar_width=30),
-                TextColumn("[progress.percentage]{task.percentage:>3.0f}%"),
-                TextColumn("•"),
-                TextColumn("{task.fields[speed]:>10}"),
-                TextColumn("•"),
-                TextColumn("{task.fields[files]}"),
-                TextColumn("•"),
-                TimeElapsedColumn(),
-                transient=True,  # Remove progress bar when done
-            ) as progress:
-                task = progress.add_task(
-                    f"Syncing {source_name}...",
-                    total=100,
-                    speed="--",
-                    files="--"
+                progress.update(task, completed=completed, speed=speed, files=files_text)
+
+            def run_shard(idx: int) -> int:
+                # Keep CPython's posix_spawn fast path (no fork of the Python heap per shard):
+                # it requires an absolute executable (_RSYNC_BIN), close_fds=False, no cwd,
+                # preexec_fn or process_group. Python's own fds are non-inheritable anyway.
+                proc = subprocess.Popen(
+                    commands[idx],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.STDOUT,
+                    text=True,
+                    bufsize=1,  # Line buffered
+                    close_fds=False
                 )
 
-                last_speed = "--"
-                error_lines = []
-
                 for line in iter(proc.stdout.readline, ''):
                     if not line:
                         break
@@ -1092,12 +2044,10 @@ class PhotoWorkflow:
                         if match:
                             matched = True
                             pct, speed, eta = match.groups()
-                            progress.update(
-                                task,
-                                completed=int(pct),
-                                speed=speed,
-                                files=f"ETA: {eta}"
-                            )
+                            with lock:
+                                shard_pct[idx] = int(pct)
+                                shard_speed[idx] = speed
+                                refresh(f"ETA: {eta}" if shard_count == 1 else f"{shard_count} streams")
                     else:
                         # Parse to-check=remaining/total for progress
                         match = progress_pattern.search(line)
@@ -1106,44 +2056,32 @@ class PhotoWorkflow:
                             remaining, total = match.groups()
                             remaining, total = int(remaining), int(total)
                             done = total - remaining
-                            pct = (done * 100) // total if total > 0 else 0
-                            progress.update(
-                                task,
-                                completed=pct,
-                                speed=last_speed,
-                                files=f"{done:,}/{total:,}"
-                            )
+                            with lock:
+                                shard_pct[idx] = (done * 100) // total if total > 0 else 0
+                                shard_files[idx] = (done, total)
+                                all_done = sum(d for d, _ in shard_files)
+                                all_total = sum(t for _, t in shard_files)
+                                refresh(f"{all_done:,}/{all_total:,}")
                         # Also try to capture speed
                         speed_match = speed_pattern.search(line)
                         if speed_match:
                             matched = True
-                            last_speed = speed_match.group(1)
+                            with lock:
+                                shard_speed[idx] = speed_match.group(1)
 
                     # Capture non-progress lines for error reporting
                     if not matched:
                         stripped = line.strip()
                         if stripped:
-                            error_lines.append(stripped)
+                            with lock:
+                                error_lines.append(stripped)
 
-                proc.wait()
+                return proc.wait()
 
-            if proc.returncode == 0:
-                stats['sync_successful'] = True
-                stats['connection_method'] = 'tailscale'
-                info(f"[green]✓[/green] {source_name.title()} backup completed via Tailscale")
-                return stats
-            else:
-                stats['errors'] += 1
-                print_error(f"Rsync failed (exit code: {proc.returncode})")
-                if error_lines:
-                    for err_line in error_lines[-5:]:  # Show last 5 error lines
-                        print_error(f"  {err_line}")
+            with ThreadPoolExecutor(max_workers=shard_count) as executor:
+                return_codes = list(executor.map(run_shard, range(shard_count)))
 
-        except Exception as e:
-            stats['errors'] += 1
-            print_error(f"Backup failed: {e}")
-
-        return stats
+        return return_codes, error_lines
 
     def backup_raws_to_homelab(self, dry_run: bool = False, progress_callback=None) -> Dict[str, any]:
         """
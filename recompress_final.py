@@ -11,8 +11,12 @@ This script will:
 Run with --dry-run first to preview!
 """
 
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
 import click
 from pathlib import Path
+from PIL import features
 from photo_flow.config import FINAL_PATH
 from photo_flow.image_processor import ImageProcessor
 from photo_flow.file_manager import scan_for_images
@@ -29,6 +33,12 @@ def recompress_final(dry_run):
     click.echo(f"Final folder: {FINAL_PATH}")
     click.echo(f"New settings: 5200×3467, Quality 92, 4:4:4 chroma")
     click.echo(f"Mode: {'DRY RUN (preview only)' if dry_run else 'LIVE (will modify files)'}")
+    # Pillow's wheels bundle libjpeg-turbo (SIMD encoder); a source build against plain
+    # libjpeg encodes several times slower
+    if features.check_feature('libjpeg_turbo'):
+        click.echo(f"JPEG encoder: libjpeg-turbo {features.version_feature('libjpeg_turbo')}")
+    else:
+        click.echo("⚠️  JPEG encoder: libjpeg without SIMD (reinstall Pillow from a wheel for libjpeg-turbo)")
     click.echo("=" * 60)
     click.echo()
 
@@ -64,26 +74,35 @@ def recompress_final(dry_run):
     skipped = 0
     errors = 0
 
-    for idx, jpg_file in enumerate(jpg_files, 1):
-        # Show progress
-        progress = f"[{idx}/{len(jpg_files)}]"
-        filename = jpg_file.name
-
-        if dry_run:
-            click.echo(f"{progress} Would re-compress: {filename}")
+    if dry_run:
+        for idx, jpg_file in enumerate(jpg_files, 1):
+            click.echo(f"[{idx}/{len(jpg_files)}] Would re-compress: {jpg_file.name}")
             compressed += 1
-        else:
-            click.echo(f"{progress} Compressing: {filename}...", nl=False)
-
-            # Compress the file (in-place)
-            success, error = ImageProcessor.compress_jpeg_safe(jpg_file)
-
-            if success:
-                click.echo(" ✅ Done")
-                compressed += 1
-            else:
-                click.echo(f" ❌ Failed: {error}")
-                errors += 1
+    else:
+        # Pillow's encoder is CPU-bound and every file is independent, so compress one file
+        # per core; results are printed in completion order
+        executor = ProcessPoolExecutor(max_workers=os.cpu_count())
+        try:
+            futures = {executor.submit(ImageProcessor.compress_jpeg_safe, jpg_file): jpg_file
+                       for jpg_file in jpg_files}
+            for idx, future in enumerate(as_completed(futures), 1):
+                progress = f"[{idx}/{len(jpg_files)}]"
+                filename = futures[future].name
+                try:
+                    success, error = future.result()
+                except Exception as e:
+                    success, error = False, str(e)
+
+                if success:
+                    click.echo(f"{progress} Compressed: {filename} ✅")
+                    compressed += 1
+                else:
+                    click.echo(f"{progress} Failed: {filename} ❌ {error}")
+                    errors += 1
+        finally:
+            # On Ctrl+C, let running compressions finish (they replace the original only
+            # after verification) but skip the rest
+            executor.shutdown(wait=True, cancel_futures=True)
 
     # Summary
     click.echo()
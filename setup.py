@@ -15,7 +15,9 @@ setup(
         "piexif>=1.1.3",
         "defusedxml>=0.7.1",
         "rich>=13.7.0",
-        "python-dotenv>=1.0.0"
+        "python-dotenv>=1.0.0",
+        "xxhash>=3.0.0",
+        "orjson>=3.8.0"
     ],
     entry_points={
         "console_scripts": [